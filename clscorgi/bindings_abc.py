@@ -1,16 +1,62 @@
 """ABC for binding generators."""
 
 import abc
-import collections
+import functools
+import os
+import re
 from urllib.parse import quote
 
+import diskcache
+import httpx
+from lxml import etree
 
-class BindingsExtractor(abc.ABC, collections.UserDict):
+# module-level client for connection pooling/keep-alive across documents
+_client = httpx.Client(
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    timeout=30
+)
+
+# path segments consisting of these characters are left unchanged by quote
+_SAFE_RE = re.compile(r"[A-Za-z0-9._\-]+")
+
+# TEI documents are small, so skip ID indexing and whitespace-only text nodes
+_parser = etree.XMLParser(
+    remove_blank_text=True,
+    collect_ids=False,
+    resolve_entities=False,
+    huge_tree=False
+)
+
+
+@functools.cache
+def get_bindings_cache(directory: str) -> diskcache.Cache:
+    """Get a disk-backed cache for extracted bindings.
+
+    Extractors for remote resources use this to memoize validated bindings
+    by URL, so re-runs only fetch new documents; see bindings_cache_key.
+    Delete directory to invalidate all entries.
+    """
+    return diskcache.Cache(directory)
+
+
+def bindings_cache_key(url: str, extractor_version: int) -> str:
+    """Construct a bindings cache key for a URL.
+
+    Extractors bump their version on logic changes,
+    so entries from earlier extractor versions are never served.
+    """
+    return f"v{extractor_version}:{url}"
+
+
+class BindingsExtractor(abc.ABC):
     """Binding Representation for an ELTeC resource."""
 
     def __init__(self, *args, **kwargs) -> None:
-        """Initialize a BindingExtractor object."""
-        self.data = self.generate_bindings()
+        """Initialize a BindingExtractor object.
+
+        Bindings are exposed as a plain dict in the data attribute.
+        """
+        self.data: dict = self.generate_bindings()
 
     @abc.abstractmethod
     def generate_bindings(self) -> dict:
@@ -18,11 +64,34 @@ class BindingsExtractor(abc.ABC, collections.UserDict):
 
     @staticmethod
     def _quote_iri(url: str) -> str:
-        """Parse and ascii quote IRIs for processing."""
-        parts = url.split("/")
-        path = parts.pop()
-        parts.append(quote(path))
+        """Parse and ascii quote IRIs for processing.
+
+        Only the last path segment gets quoted;
+        if it is already ASCII-safe, the IRI is returned unchanged.
+        """
+        i = url.rfind("/")
+        tail = url[i + 1:]
 
-        quoted_iri = "/".join(parts)
+        if _SAFE_RE.fullmatch(tail):
+            return url
 
-        return quoted_iri
+        return url[:i + 1] + quote(tail)
+
+    @staticmethod
+    def _fetch(url: str) -> bytes:
+        """Fetch the content of a remote resource."""
+        response = _client.get(url)
+        response.raise_for_status()
+
+        return response.content
+
+    @classmethod
+    def _fetch_tree(cls, url: str) -> etree._ElementTree:
+        """Fetch a remote XML resource and parse it in memory."""
+        root = etree.fromstring(cls._fetch(url), parser=_parser)
+        return root.getroottree()
+
+    @staticmethod
+    def _parse_tree(path: str | os.PathLike) -> etree._ElementTree:
+        """Parse a local XML file with the shared TEI parser."""
+        return etree.parse(path, parser=_parser)
@@ -1,38 +1,63 @@
-import json
-
+from concurrent.futures import Future, ThreadPoolExecutor
 from itertools import count
+import logging
 
 from importlib.resources.abc import Traversable
 from importlib.resources import files
 
+import ijson
+import orjson
 from more_itertools import ichunked
 
 
+logger = logging.getLogger(__name__)
+
+
+def _write_chunk(output_file: Traversable, data: bytes) -> None:
+    logger.debug("Writing '%s'.", output_file)
+
+    with open(output_file, "wb") as f:
+        f.write(data)
+
+
 def generate_metadata_files():
 
     data_dir: Traversable = files("clscorgi.dlk.data.dlk_json_dump")
     dlk_json_path: Traversable = data_dir / "dlk_full.json"
     cnt = count()
 
-    with open(dlk_json_path) as f:
-        dlk_json = json.load(f)
+    with open(dlk_json_path, "rb") as f, ThreadPoolExecutor(max_workers=1) as executor:
+        # stream top-level entries; one 6000-entry chunk gets materialized at a time
+        _metadata = map(
+            lambda entry: {
+                "id": entry[0],
+                "metadata": entry[1]["metadata"]
+            },
+            ijson.kvitems(f, "", use_float=True)
+        )
+
+        dlk_chunks = ichunked(_metadata, 6000)
+
+        # chunks share the underlying stream, so they get serialized in order here;
+        # the write of the previous chunk overlaps with serializing the next one,
+        # but at most one write is in flight so serialized chunks can't pile up
+        pending: Future | None = None
+
+        for chunk in dlk_chunks:
+            data = orjson.dumps(list(chunk), option=orjson.OPT_INDENT_2)
 
-    _metadata = map(
-        lambda entry: {
-            "id": entry[0],
-            "metadata": entry[1]["metadata"]
-        },
-        dlk_json.items()
-    )
+            if pending is not None:
+                pending.result()
 
-    dlk_chunks = ichunked(_metadata, 6000)
+            pending = executor.submit(
+                _write_chunk,
+                data_dir / f"dlk_metadata_{next(cnt)}.json",
+                data
+            )
 
-    for chunk in dlk_chunks:
-        output_file = data_dir / f"dlk_metadata_{next(cnt)}.json"
-        print(output_file)
+        if pending is not None:
+            pending.result()
 
-        with open(output_file, "w") as f:
-            f.write(json.dumps(list(chunk), indent=4))
 
 if __name__ == "__main__":
     generate_metadata_files()
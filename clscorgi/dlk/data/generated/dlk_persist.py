@@ -1,28 +1,40 @@
 """Persist DLK data as JSON for further processing."""
 
-import json
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from importlib.resources import files
+import logging
 
 from clscorgi.dlk.extractors.bindings_extractor import DLKBindingsExtractor
 from clscorgi.dlk.extractors.link_extractor import get_dlk_raw_links
-from clscorgi.models import DLKBindingsModel
+import orjson
 
 
-def get_dlk_data() -> Iterator[dict]:
-    """Generate dlk data."""
+logger = logging.getLogger(__name__)
+
+
+def _extract_dlk_bindings(dlk_uri: str) -> dict:
+    """Fetch and extract bindings for a single DLK resource."""
+    logger.debug("Processing '%s'.", dlk_uri)
+    return DLKBindingsExtractor(dlk_uri).data
+
+
+def get_dlk_data(max_workers: int = 32) -> Iterator[dict]:
+    """Generate dlk data.
+
+    Extraction is network-bound, so resources get fetched concurrently;
+    executor.map preserves the order of the raw links;
+    bindings are validated by DLKBindingsExtractor.
+    """
     dlk_uris = get_dlk_raw_links()
 
-    for dlk_uri in dlk_uris:
-        print(f"Processing '{dlk_uri}'...")
-        dlk_bindings = DLKBindingsExtractor(dlk_uri)
-        DLKBindingsModel(**dlk_bindings)
-        yield dict(dlk_bindings)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(_extract_dlk_bindings, dlk_uris)
 
 
 if __name__ == "__main__":
     data_file = files("clscorgi.dlk.data.generated") / "dlk.json"
     data = list(get_dlk_data())
 
-    with open(data_file, "w") as f:
-        json.dump(data, f, indent=4)
+    with open(data_file, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
@@ -1,30 +1,24 @@
 """Binding extractor for the DLK corpus."""
 
 import re
-from dataclasses import InitVar, dataclass
-from pathlib import Path
-from urllib.request import urlretrieve
+from importlib.resources import files
 
-from clscorgi.bindings_abc import BindingsExtractor
-from clscorgi.dlk.extractors.tree_extractors import (get_artificial_title,
-                                                     get_author_names,
-                                                     get_features,
-                                                     get_publication_date,
-                                                     get_title, get_urn)
-from lxml import etree
+from clscorgi.bindings_abc import (BindingsExtractor, bindings_cache_key,
+                                   get_bindings_cache)
+from clscorgi.dlk.extractors.tree_extractors import iterextract
+from clscorgi.models import DLKBindingsModel
 
+_DLK_ID_RE = re.compile(r"([\w.]+)-")
+_cache_dir = files("clscorgi.dlk.data") / "_fetch_cache"
+# bump on extraction logic changes to invalidate cached bindings
+_extractor_version: int = 1
 
-@dataclass
-class DLKPath:
-    """Object representation for DLK raw links."""
 
-    _eltec_url: InitVar
-
-    def __post_init__(self, dlk_url):
-        """Postinit hook for DLKPath."""
-        self.url = dlk_url
-        # todo: regex needs revision
-        self.dlk_id = re.search(r".+/([\w.]+)-.+", dlk_url).group(1)
+def _parse_dlk_url(dlk_url: str) -> tuple[str, str]:
+    """Get the resource URI and DLK ID from a DLK raw link."""
+    # todo: regex needs revision
+    dlk_id = _DLK_ID_RE.match(dlk_url.rsplit("/", 1)[-1]).group(1)
+    return dlk_url, dlk_id
 
 
 class DLKBindingsExtractor(BindingsExtractor):
@@ -33,26 +27,32 @@ class DLKBindingsExtractor(BindingsExtractor):
     def __init__(self, dlk_url: str):
         self.dlk_url = self._quote_iri(dlk_url)
         # self.dlk_url = dlk_url
-        self.dlk_path = DLKPath(dlk_url)
+        self.resource_uri, self.dlk_id = _parse_dlk_url(dlk_url)
 
         super().__init__()
 
     def generate_bindings(self) -> dict:
         """Construct kwarg bindings for RDF generation."""
-        _temp_file_name, _ = urlretrieve(self.dlk_url)
+        cache = get_bindings_cache(str(_cache_dir))
+        cache_key = bindings_cache_key(self.dlk_url, _extractor_version)
+
+        if (cached_bindings := cache.get(cache_key)) is not None:
+            return cached_bindings
 
-        with open(_temp_file_name) as f:
-            tree = etree.parse(f)
+        tree_data = iterextract(self._fetch(self.dlk_url))
 
         bindings = {
-            "resource_uri": self.dlk_path.url,
-            "urn": get_urn(tree),
-            "dlk_id": self.dlk_path.dlk_id,
-            "authors": list(get_author_names(tree)),
-            "title": get_title(tree),
-            "artificial_title": get_artificial_title(tree),
-            "features_dlk": get_features(tree),
-            "publication_date": get_publication_date(tree)
+            "resource_uri": self.resource_uri,
+            "urn": tree_data["urn"],
+            "dlk_id": self.dlk_id,
+            "authors": tree_data["authors"],
+            "title": tree_data["title"],
+            "artificial_title": tree_data["artificial_title"],
+            "features_dlk": tree_data["features_dlk"],
+            "publication_date": tree_data["publication_date"]
         }
 
+        DLKBindingsModel(**bindings)
+        cache.set(cache_key, bindings)
+
         return bindings
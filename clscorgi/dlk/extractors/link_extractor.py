@@ -1,30 +1,68 @@
 """Link extractor for the DLK repo."""
 
+import json
 import os
 
-from collections.abc import Callable, Iterator
-from functools import partial
+from collections.abc import Callable
+from functools import cache, lru_cache, partial
+from importlib.resources import files
+from typing import TYPE_CHECKING
 
-from github import Github, Auth
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from github import Github
 
-load_dotenv()
-token = os.getenv("TOKEN")
-auth = Auth.Token(token)
 
-g = Github(auth=auth)
+_link_cache = files("clscorgi.dlk.data") / "_link_cache.json"
 
-def _get_raw_links(repository: str) -> Iterator[str]:
-    """Get raw XML file links from level1 of an ELTeC repo."""
+
+@cache
+def _get_client(token: str | None) -> "Github":
+    """Construct an authenticated Github client; PyGithub only gets imported on first use."""
+    from github import Github, Auth
+
+    return Github(auth=Auth.Token(token))
+
+
+def _read_link_cache() -> dict[str, list[str]]:
+    """Read the on-disk link cache; return an empty dict if there is none."""
+    if not _link_cache.is_file():
+        return {}
+
+    with open(_link_cache) as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _get_raw_links(repository: str) -> tuple[str, ...]:
+    """Get raw XML file links from the tei_plain folder of the DLK repo.
+
+    Links are cached on disk (dlk/data/_link_cache.json), so the Github API
+    only gets queried if there is no cache entry for repository;
+    delete the cache file to force a refresh.
+    """
+    link_cache = _read_link_cache()
+
+    if (cached_links := link_cache.get(repository)) is not None:
+        return tuple(cached_links)
+
+    load_dotenv()
+    token = os.getenv("TOKEN")
+    g = _get_client(token)
     repo = g.get_repo(repository)
     contents = repo.get_contents("DLK/tei/tei_plain")
 
-    for content in contents:
-        yield (
-            "https://raw.githubusercontent.com/tnhaider/DLK/master/DLK/tei/tei_plain/"
-            f"{content.name}"
-        )
+    links = tuple(
+        "https://raw.githubusercontent.com/tnhaider/DLK/master/DLK/tei/tei_plain/"
+        f"{content.name}"
+        for content in contents
+    )
+
+    with open(_link_cache, "w") as f:
+        json.dump(link_cache | {repository: links}, f, indent=4)
+
+    return links
 
 
-get_dlk_raw_links: Callable[[], Iterator] = partial(_get_raw_links, "tnhaider/DLK")
+get_dlk_raw_links: Callable[[], tuple[str, ...]] = partial(_get_raw_links, "tnhaider/DLK")
@@ -1,83 +1,196 @@
 """XML tree extractors for the DLK corpus."""
 
-import re
-from collections.abc import Callable, Iterator
-from functools import partial
+from collections.abc import Iterator
+from io import BytesIO
+from typing import TypeVar
 
-from clscorgi.utils.utils import (construct_artificial_title, unescape,
-                                  unescaped)
+from clscorgi.utils.utils import construct_artificial_title, unescape
 from lxml import etree
 
-TEIXPath = partial(
-    etree.XPath,
-    namespaces={
-        "tei": "http://www.tei-c.org/ns/1.0"
-    }
-)
+T = TypeVar("T")
 
+_TEI = "{http://www.tei-c.org/ns/1.0}"
 
-def get_features(tree: etree._ElementTree) -> dict:
-    """Extract the linguistic feature counts from a DLK tree."""
-    xpath_result = TEIXPath("//tei:extent")(tree)
+_EXTENT = f"{_TEI}extent"
+_AUTHOR = f"{_TEI}author"
+_TITLE = f"{_TEI}title"
+_TITLE_STMT = f"{_TEI}titleStmt"
+_P = f"{_TEI}p"
+_SOURCE_DESC = f"{_TEI}sourceDesc"
+_DATE = f"{_TEI}date"
+_PUBLICATION_STMT = f"{_TEI}publicationStmt"
+_LG = f"{_TEI}lg"
+_L = f"{_TEI}l"
 
-    features = {
-        element.xpath("@type")[0]: element.text
-        for element in xpath_result[0]
-    }
+_SURNAME_PATH = f"{_TEI}persName/{_TEI}surname"
+_FORENAME_PATH = f"{_TEI}persName/{_TEI}forename"
 
-    return features
+_TAGS = (_EXTENT, _AUTHOR, _TITLE, _P, _DATE, _L)
 
 
-def get_author_names(tree: etree._ElementTree) -> Iterator[dict]:
-    """Extract author names from a DLK tree."""
-    xpath_result = TEIXPath("//tei:author")(tree)
+def _required(value: T | None, name: str) -> T:
+    """Fail on a missing required value.
 
-    for element in xpath_result:
-        surname = unescape(TEIXPath("tei:persName/tei:surname/text()")(element)[0])
-        forename = unescape(TEIXPath("tei:persName/tei:forename/text()")(element)[0])
+    Raises IndexError like an empty XPath result indexed with [0] would.
+    """
+    if value is None:
+        raise IndexError(f"DLK document has no {name}.")
+    return value
 
-        names = {
-            "forename": forename,
-            "surname": surname,
-            "full_name": f"{forename} {surname}"
-        }
 
-        yield names
+def _first_text(element: etree._Element) -> str | None:
+    """Get the first text node of an element, i.e. XPath 'text()[1]'."""
+    if element.text is not None:
+        return element.text
 
+    return next(
+        (child.tail for child in element if child.tail is not None),
+        None
+    )
 
-@unescaped
-def get_title(tree: etree._ElementTree) -> str | None:
-    """Extract title from a DLK tree."""
-    try:
-        title = TEIXPath("//tei:titleStmt/tei:title/text()")(tree)[0]
-        title = title.strip()
 
-        if re.search(r"N\.A\.", title):
-            title = None
-    except IndexError:
-        title = None
+def _find_first_text(element: etree._Element, path: str) -> str | None:
+    """Get the first text node of all elements matching path.
 
-    return title
+    Equivalent to XPath '(path/text())[1]'.
+    """
+    return next(
+        (
+            text for match in element.iterfind(path)
+            if (text := _first_text(match)) is not None
+        ),
+        None
+    )
 
 
-@unescaped
-def get_artificial_title(tree: etree._ElementTree) -> str:
-    """Extract the first line text from a DLK tree and construt a title."""
-    first_line = TEIXPath("//tei:lg[@type='poem']/tei:lg/tei:l[1]/text()")(tree)[0]
-    artificial_title = construct_artificial_title(first_line.strip(","))
-    return artificial_title
+def _features(extent: etree._Element) -> dict:
+    """Extract the linguistic feature counts from a tei:extent element."""
+    return {
+        element.xpath("@type")[0]: element.text
+        for element in extent
+    }
 
 
-def get_urn(tree: etree._ElementTree) -> str:
-    """Extract URN from a DLK tree."""
-    urn = TEIXPath("//tei:sourceDesc/tei:p/@corresp")(tree)[0]
-    return urn
+def _author_names(author: etree._Element) -> dict:
+    """Extract names from a tei:author element."""
+    surname = _required(_find_first_text(author, _SURNAME_PATH), "author surname")
+    forename = _required(_find_first_text(author, _FORENAME_PATH), "author forename")
+    surname, forename = unescape(surname), unescape(forename)
 
+    return {
+        "forename": forename,
+        "surname": surname,
+        "full_name": f"{forename} {surname}"
+    }
+
+
+def _sanitize_title(title: str) -> str | None:
+    """Strip a title and discard 'N.A.' placeholders."""
+    title = title.strip()
+    return None if "N.A." in title else title
+
+
+def _extract(elements: Iterator[etree._Element]) -> dict:
+    """Extract all DLK values from an iterator of candidate elements.
+
+    Elements are expected in document order and are dispatched on their tags.
+    Only the title is optional; other missing values raise an IndexError.
+    """
+    extent = title = urn = first_line = publication_date = None
+    authors: list[dict] = []
+
+    for element in elements:
+        tag = element.tag
+        parent = element.getparent()
+
+        if tag == _AUTHOR:
+            authors.append(_author_names(element))
+        elif tag == _EXTENT:
+            if extent is None:
+                extent = _features(element)
+        elif tag == _TITLE:
+            if title is None and parent.tag == _TITLE_STMT:
+                title = _first_text(element)
+        elif tag == _P:
+            if urn is None and parent.tag == _SOURCE_DESC:
+                urn = element.get("corresp")
+        elif tag == _DATE:
+            if (
+                    publication_date is None
+                    and parent.tag == _PUBLICATION_STMT
+                    and element.get("type") == "publication"
+            ):
+                publication_date = _first_text(element)
+        elif tag == _L:
+            if (
+                    first_line is None
+                    and parent.tag == _LG
+                    and parent.find(_L) is element
+                    and (grandparent := parent.getparent()) is not None
+                    and grandparent.tag == _LG
+                    and grandparent.get("type") == "poem"
+            ):
+                first_line = _first_text(element)
+
+    if title is not None and (title := _sanitize_title(title)) is not None:
+        title = unescape(title)
+
+    first_line = _required(first_line, "first poem line")
+    artificial_title = unescape(construct_artificial_title(first_line.strip(",")))
+
+    return {
+        "urn": _required(urn, "URN"),
+        "authors": authors,
+        "title": title,
+        "artificial_title": artificial_title,
+        "features_dlk": _required(extent, "extent"),
+        "publication_date": _required(publication_date, "publication date")
+    }
 
-def get_publication_date(tree: etree._ElementTree) -> str:
-    """Extract the publication date from a DLK tree."""
-    xpath: str = "//tei:publicationStmt/tei:date[@type='publication']/text()"
-    date: str = TEIXPath(xpath)(tree)[0]
-    return date
 
-##################################################
+def _iterparse(source: bytes) -> Iterator[etree._Element]:
+    """Incrementally parse source and yield candidate elements.
+
+    Top-level candidates (i.e. without a candidate ancestor) get cleared once
+    they are consumed and processed siblings get dropped, so the full tree
+    is never built. Nested candidates (e.g. a tei:date inside tei:author) are
+    left alone until their enclosing candidate is done, since pruning them
+    would strip content the enclosing candidate still needs.
+    Preceding tei:l siblings are kept (as cleared shells)
+    since the tei:l[1] check depends on them.
+    """
+    context = etree.iterparse(
+        BytesIO(source),
+        events=("start", "end"),
+        tag=_TAGS,
+        remove_blank_text=True,
+        collect_ids=False,
+        resolve_entities=False
+    )
+    depth = 0
+
+    for event, element in context:
+        if event == "start":
+            depth += 1
+            continue
+
+        depth -= 1
+        yield element
+
+        if depth:
+            continue
+
+        element.clear(keep_tail=True)
+
+        if element.tag != _L:
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+def iterextract(source: bytes) -> dict:
+    """Extract all DLK values from XML bytes without building the full tree.
+
+    A single pass over lxml.etree.iterparse events dispatches on element tags;
+    raises IndexError if a required value (see _extract) is missing.
+    """
+    return _extract(_iterparse(source))
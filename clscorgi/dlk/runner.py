@@ -1,24 +1,27 @@
 """DLK runner: Main entry point for DLK RDF conversions."""
 
 import itertools
-import json
 from collections.abc import Iterator
 from importlib.resources import files
 
 from clisn import CLSInfraNamespaceManager
+from clscorgi.models import DLKBindingsModel
 from clscorgi.rdfgenerators import DLKRDFGenerator
 from lodkit import _Triple
+from pydantic import TypeAdapter
 from rdflib import Graph
 
+_bindings_adapter = TypeAdapter(list[DLKBindingsModel])
+
 
 def _generate_triples() -> Iterator[_Triple]:
     data_file = files("clscorgi.dlk.data.generated") / "dlk.json"
 
-    with open(data_file) as f:
-        data = json.load(f)
+    with open(data_file, "rb") as f:
+        data = _bindings_adapter.validate_json(f.read())
 
     triples = itertools.chain.from_iterable(
-        DLKRDFGenerator(**bindings)
+        DLKRDFGenerator(bindings_model=bindings)
         for bindings in data
     )
 
@@ -35,8 +38,7 @@ def dlk_runner() -> None:
 
     triples = _generate_triples()
 
-    for triple in triples:
-        graph.add(triple)
+    graph.addN((s, p, o, graph) for s, p, o in triples)
 
-    with open(output_file, "w") as f:
-        f.write(graph.serialize())
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        graph.serialize(destination=f, format="turtle", encoding="utf-8")
@@ -2,6 +2,7 @@
 
 import json
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from importlib.resources import files
 
 from clscorgi.eltec.extractors.bindings_extractor import ELTeCBindingsExtractor
@@ -15,15 +16,25 @@ _REPOS: list[str] = [
     "ELTeC-spa",
 ]
 
+
+def get_eltec_data(uris: Iterator[str], max_workers: int = 32) -> list[dict]:
+    """Concurrently extract ELTeC bindings from raw XML links.
+
+    executor.map preserves the order of uris.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [
+            extractor.data
+            for extractor in executor.map(ELTeCBindingsExtractor, uris)
+        ]
+
+
 if __name__ == "__main__":
     for repo in _REPOS:
         uris: Iterator[str] = get_eltec_xml_links(repos=[repo])
         data_file = files("clscorgi.eltec.data.generated") / f"{repo.lower()}.json"
 
-        bindings = [
-            dict(ELTeCBindingsExtractor(uri))
-            for uri in uris
-        ]
+        bindings = get_eltec_data(uris)
 
         with open(data_file, "w") as f:
             json.dump(bindings, f, indent=4)
@@ -2,15 +2,20 @@
 
 import collections
 from dataclasses import InitVar, dataclass
+from importlib.resources import files
 from pathlib import Path
-from urllib.request import urlretrieve
 
-from clscorgi.bindings_abc import BindingsExtractor
+from clscorgi.bindings_abc import (BindingsExtractor, bindings_cache_key,
+                                   get_bindings_cache)
 from clscorgi.eltec.extractors.tree_extractors import (get_author_ids,
                                                        get_author_name,
                                                        get_date, get_work_ids,
                                                        get_work_title)
-from lxml import etree
+from clscorgi.models import ELTeCBindingsModel
+
+_cache_dir = files("clscorgi.eltec.data") / "_fetch_cache"
+# bump on extraction logic changes to invalidate cached bindings
+_extractor_version: int = 1
 
 
 @dataclass
@@ -39,10 +44,13 @@ class ELTeCBindingsExtractor(BindingsExtractor):
 
     def generate_bindings(self) -> dict:
         """Construct kwarg bindings for RDF generation."""
-        _temp_file_name, _ = urlretrieve(self._eltec_url)
+        cache = get_bindings_cache(str(_cache_dir))
+        cache_key = bindings_cache_key(self._eltec_url, _extractor_version)
+
+        if (cached_bindings := cache.get(cache_key)) is not None:
+            return cached_bindings
 
-        with open(_temp_file_name) as f:
-            tree = etree.parse(f)
+        tree = self._fetch_tree(self._eltec_url)
 
         bindings = {
             "resource_uri": self._eltec_path.url,
@@ -58,4 +66,7 @@ class ELTeCBindingsExtractor(BindingsExtractor):
             "date": get_date(tree)
         }
 
+        ELTeCBindingsModel(**bindings)
+        cache.set(cache_key, bindings)
+
         return bindings
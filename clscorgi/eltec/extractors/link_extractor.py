@@ -4,40 +4,61 @@ import re
 import os
 
 from collections.abc import Iterator, Iterable
-from typing import Literal
+from functools import cache
+from typing import TYPE_CHECKING, Literal
 
-from github import Github, Auth
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from github import Github
 
-# get token
-load_dotenv()
-token = os.getenv("TOKEN")
-auth = Auth.Token(token)
 
-g = Github(auth=auth)
+@cache
+def _get_client(token: str | None) -> "Github":
+    """Construct an authenticated Github client; PyGithub only gets imported on first use."""
+    from github import Github, Auth
+
+    return Github(auth=Auth.Token(token))
+
+
+def _get_github() -> "Github":
+    """Get the Github client for the TOKEN env variable."""
+    load_dotenv()
+    token = os.getenv("TOKEN")
+
+    return _get_client(token)
 
 
 def _get_raw_links(repository: str) -> Iterator[str]:
-    """Get raw XML file links from level1 of an ELTeC repo."""
-    repo = g.get_repo(repository)
-    contents = repo.get_contents("")
+    """Get raw XML file links from level1 of an ELTeC repo.
 
-    try:
-        level1_dir = next(filter(lambda x: x.name == "level1", contents))
-    except StopIteration:
-        print(f"INFO: No 'level1' for '{repository}'.")
+    Uses the Git Trees API: besides the repo lookup, the level1 listing
+    is retrieved with a single recursive tree request for the default branch.
+    """
+    g = _get_github()
+    repo = g.get_repo(repository)
+    branch = repo.default_branch
+
+    level1_files = [
+        f.path
+        for f in repo.get_git_tree(branch, recursive=True).tree
+        if f.type == "blob"
+        and f.path.startswith("level1/")
+        and f.path.count("/") == 1
+        and f.path.endswith(".xml")
+    ]
+
+    if not level1_files:
+        print(f"INFO: No 'level1' XML files for '{repository}'.")
         return None
 
-    for f in repo.get_contents(level1_dir.path):
-        download_url = f.download_url
-        if download_url and download_url.endswith(".xml"):
-            yield download_url
+    for path in level1_files:
+        yield f"https://raw.githubusercontent.com/{repository}/{branch}/{path}"
 
 
 def _get_user_repos(username: str):
     """Get all repos given a Github username."""
-    user = g.get_user(username)
+    user = _get_github().get_user(username)
     user_repos = user.get_repos()
 
     for repo in user_repos:
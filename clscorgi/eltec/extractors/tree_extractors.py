@@ -38,12 +38,29 @@ def _digital_source(partial_xpath: str):
     return f"{_digi_source}{_partial}"
 
 
+# precompiled XPath objects; compiled once at import, not per document
+_XP_DIGITAL_SOURCE_TITLE = TEIXPath(_digital_source("tei:title/text()"))
+_XP_TITLE_STMT_TITLE = TEIXPath("//tei:titleStmt/tei:title/text()")
+_XP_AUTHOR = TEIXPath("//tei:titleStmt/tei:author/text()")
+_XP_AUTHOR_FORENAME = TEIXPath(
+    "//tei:titleStmt/tei:author/tei:persName/tei:forename/text()"
+)
+_XP_AUTHOR_SURNAME = TEIXPath(
+    "//tei:titleStmt/tei:author/tei:persName/tei:surname/text()"
+)
+_XP_AUTHOR_REF = TEIXPath("//tei:titleStmt/tei:author/@ref")
+_XP_SOURCE_BIBL = TEIXPath("//tei:sourceDesc/tei:bibl")
+_XP_SOURCE_BIBL_DATE = TEIXPath("//tei:sourceDesc/tei:bibl/tei:date/text()")
+_XP_REF_TARGET = TEIXPath("tei:ref/@target")
+_XP_TYPE = TEIXPath("@type")
+
+
 def _get_title_from_sourcedesc(tree: etree._ElementTree) -> str | None:
     """Try to get source_title from sourceDesc.
 
     XPath extractor for get_source_title.
     """
-    xpath_result = TEIXPath(_digital_source("tei:title/text()"))(tree)
+    xpath_result = _XP_DIGITAL_SOURCE_TITLE(tree)
 
     if xpath_result:
         return trim(xpath_result[0])
@@ -56,7 +73,7 @@ def _get_title_from_titlestmt(tree: etree._ElementTree) -> str | None:
 
     XPath extractor for get_source_title.
     """
-    xpath_result = TEIXPath("//tei:titleStmt/tei:title/text()")(tree)
+    xpath_result = _XP_TITLE_STMT_TITLE(tree)
 
     if xpath_result:
         _title = xpath_result[0]
@@ -94,11 +111,11 @@ def get_work_title(tree: etree._ElementTree) -> str | None:
 
 def get_author_name(tree: etree._ElementTree) -> str:
     """Extract the author name from tei:titleStmt."""
-    name = trim(first(TEIXPath("//tei:titleStmt/tei:author/text()")(tree)))
+    name = trim(first(_XP_AUTHOR(tree), ""))
     # new schema fix
     if not name:
-        _forename = TEIXPath("//tei:titleStmt/tei:author/tei:persName/tei:forename/text()")(tree)
-        _surname = TEIXPath("//tei:titleStmt/tei:author/tei:persName/tei:surname/text()")(tree)
+        _forename = _XP_AUTHOR_FORENAME(tree)
+        _surname = _XP_AUTHOR_SURNAME(tree)
         alt_name = f"{trim(first(_forename))} {trim(first(_surname))}"
     return name
 
@@ -110,14 +127,14 @@ def get_work_ids(tree: etree._ElementTree) -> list[dict]:
     If no ids can be retrieved, return an empty dict,
     else the validator will fail.
     """
-    bibls = TEIXPath("//tei:sourceDesc/tei:bibl")(tree)
+    bibls = _XP_SOURCE_BIBL(tree)
 
     def _work_ids():
         for bibl in bibls:
-            id_value = first(TEIXPath("tei:ref/@target")(bibl))
+            id_value = first(_XP_REF_TARGET(bibl))
             if id_value:
                 id_type = _get_id_type(id_value)
-                source_type = trim(first(TEIXPath("@type")(bibl)))
+                source_type = trim(first(_XP_TYPE(bibl)))
 
                 yield {
                     "id_value": id_value,
@@ -130,7 +147,7 @@ def get_work_ids(tree: etree._ElementTree) -> list[dict]:
 
 def get_date(tree: etree._ElementTree):
     """Extract date from bibl."""
-    date_bibl = TEIXPath("//tei:sourceDesc/tei:bibl/tei:date/text()")(tree)
+    date_bibl = _XP_SOURCE_BIBL_DATE(tree)
     date_bibl = [trim(date) for date in date_bibl]
     if date_bibl:
         date = min(date_bibl)
@@ -147,7 +164,7 @@ def get_author_ids(tree: etree._ElementTree) -> list[dict]:
     else the validator will fail.
     """
     # deu/spa: titleStmt/author/@ref
-    _author_ids = TEIXPath("//tei:titleStmt/tei:author/@ref")(tree)
+    _author_ids = _XP_AUTHOR_REF(tree)
     return [
         {
             "id_type": _get_id_type(author_id),
@@ -1,36 +1,65 @@
 """ELTeC runner: Main entry point for ELTeC conversions."""
 
-import json
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
 from importlib.resources import files
 from pathlib import Path
 
 from clisn import CLSInfraNamespaceManager
+from clscorgi.models import ELTeCBindingsModel
 from clscorgi.rdfgenerators import ELTeCRDFGenerator
 from lodkit.graph import Graph
+from pydantic import TypeAdapter
+
+_INPUT_DIR = files("clscorgi.eltec.data.generated")
+_OUTPUT_DIR = files("clscorgi.output.eltec")
+
+_bindings_adapter = TypeAdapter(list[ELTeCBindingsModel])
+
+
+def _generate_graph(input_name: str, input_file: Path) -> None:
+    """Generate and serialize the graph for a single ELTeC repo."""
+    # validate straight from JSON bytes, no intermediate dicts
+    with open(input_file, "rb") as input_f:
+        bindings = _bindings_adapter.validate_json(input_f.read())
+
+    g = Graph()
+    CLSInfraNamespaceManager(g)
+
+    # corpus-level triples are repo-constant, so only emit them once per repo
+    corpus_triples = itertools.chain.from_iterable(
+        ELTeCRDFGenerator.generate_corpus_triples(repo_id)
+        for repo_id in {bindings_model.repo_id for bindings_model in bindings}
+    )
+
+    work_triples = itertools.chain.from_iterable(
+        ELTeCRDFGenerator(bindings_model=bindings_model, include_corpus_triples=False)
+        for bindings_model in bindings
+    )
+
+    triples = itertools.chain(corpus_triples, work_triples)
+    g.addN((s, p, o, g) for s, p, o in triples)
+
+    output_file = _OUTPUT_DIR / f"{input_name}.ttl"
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        g.serialize(destination=f, format="turtle", encoding="utf-8")
 
 
 def eltec_runner() -> None:
-    """ELTeC runner."""
+    """ELTeC runner.
+
+    Repos are independent (one output file each),
+    so graphs get generated in separate processes.
+    """
     input_files: dict[str, Path] = {
         input_file.stem: input_file
-        for input_file in files("clscorgi.eltec.data.generated").iterdir()
-        if input_file.name.split(".")[-1] == "json"
+        for input_file in _INPUT_DIR.iterdir()
+        if input_file.name.endswith(".json")
     }
 
-    for input_name, input_file in input_files.items():
-        with open(input_file) as input_f:
-            input_json = json.load(input_f)
-
-        g = Graph()
-        CLSInfraNamespaceManager(g)
-
-        for data in input_json:
-            triples = ELTeCRDFGenerator(**data)
-
-            for triple in triples:
-                g.add(triple)
+    max_workers = min(len(input_files), os.cpu_count() or 1) or 1
 
-        output_dir = files("clscorgi.output.eltec")
-        output_file = output_dir / f"{input_name}.ttl"
-        with open(output_file, "w") as f:
-            f.write(g.serialize())
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # consume the results so that worker exceptions propagate
+        list(executor.map(_generate_graph, input_files.keys(), input_files.values()))
@@ -18,6 +18,9 @@ from clscorgi.utils.utils import resolve_source_type
 
 mkuri = mkuri_factory(clscore)
 
+_tei_format_uri = vocab("TEI")
+_e55_eltec_id_uri = mkuri("ELTeC ID")
+
 
 class eltec_f3_triples:
     def __init__(
@@ -37,8 +40,10 @@ class eltec_f3_triples:
         return next(self)
 
     def f3_triples(self, work_id):
+        f3_uri = mkuri(f"f3 {work_id.id_value}")
+
         yield from ttl(
-            mkuri(f"f3 {work_id.id_value}"),
+            f3_uri,
             (RDF.type, lrm.F3_Manifestation),
             (
                 RDFS.label,
@@ -54,14 +59,16 @@ class eltec_f3_triples:
             )
             vocab_uri = vocab(source_type)
             yield (
-                mkuri(f"f3 {work_id.id_value}"),
+                f3_uri,
                 crm.P2_has_type,
                 vocab_uri
             )
 
     def e42_triples(self, work_id):
+        e42_uri = mkuri(f"e42 {work_id.id_value}")
+
         yield from ttl(
-            mkuri(f"e42 {work_id.id_value}"),
+            e42_uri,
             (RDF.type, crm.E42_Identifier),
             (RDFS.label, Literal(f"{self.bindings.work_title} [ID]")),
             (crm.P190_has_symbolic_content, Literal(f"{work_id.id_value}"))
@@ -70,7 +77,7 @@ class eltec_f3_triples:
         with suppress(VocabLookupException):
             vocab_uri = vocab(work_id.id_type)
             yield (
-                mkuri(f"e42 {work_id.id_value}"),
+                e42_uri,
                 crm.P2_has_type,
                 vocab_uri
             )
@@ -102,8 +109,10 @@ def eltec_wemi_triples(
     ## todo: this should be done in f3 triple generator
     # (lrm.R4i_is_embodied_in, (namespace.x2, *f3_uris))
 
+    x1_uri = mkuri(bindings.repo_id)
+
     x1_triples = ttl(
-        mkuri(bindings.repo_id),
+        x1_uri,
         ## todo: crmcls vs. clscore?!
         (RDF.type, crmcls.X1_Corpus),
         (crm.P1_is_identified_by, ttl(
@@ -118,7 +127,7 @@ def eltec_wemi_triples(
     x1_eltec_triples = ttl(
         namespace.x1_eltec,
         (RDF.type, crmcls.X1_Corpus),
-        (crmcls.Y4_has_subcorpus, mkuri(bindings.repo_id)),
+        (crmcls.Y4_has_subcorpus, x1_uri),
         (crm.P148_has_component, namespace.x2)
     )
 
@@ -128,8 +137,8 @@ def eltec_wemi_triples(
         (RDFS.label, Literal(f"{bindings.work_title} [TEI Document]")),
         (crm.P1_is_identified_by, namespace.x2_e42),
         (lrm.R4_embodies, namespace.f2),
-        (lrm.R71i_is_part_of, mkuri(bindings.repo_id)),
-        (crmcls.Y2_has_format, vocab("TEI")),
+        (lrm.R71i_is_part_of, x1_uri),
+        (crmcls.Y2_has_format, _tei_format_uri),
         (crmcls.Y3_adheres_to_schema, namespace.x8_eltec),
         (crm.P137_exemplifies, namespace.x11_eltec)
     )
@@ -140,7 +149,7 @@ def eltec_wemi_triples(
         (RDFS.label, Literal(f"{bindings.work_title} [ELTeC ID]")),
         (crm.P190_has_symbolic_content, Literal(f"{bindings.file_stem}")),
         # todo: generate uri in namespace class
-        (crm.P2_has_type, mkuri("ELTeC ID"))
+        (crm.P2_has_type, _e55_eltec_id_uri)
     )
 
     triples = chain(
@@ -1,8 +1,13 @@
 """Data extraction generator for ELTeC features."""
 
-import json
 from collections.abc import Iterable, Iterator
-from urllib.request import urlretrieve
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import orjson
+
+# pooled client: keep-alive connection reuse across feature files
+_client = httpx.Client(timeout=30)
 
 _REPOS: list[str] = [
     "ELTeC-eng",
@@ -24,11 +29,21 @@ def _get_eltec_features_links(repos: Iterable[str] = _REPOS) -> Iterator[str]:
         yield _template.format(repo)
 
 
+def _get_feature_data(link: str) -> list[dict]:
+    """Retrieve a single remote ELTeC features file."""
+    response = _client.get(link)
+    response.raise_for_status()
+
+    return orjson.loads(response.content)
+
+
 def get_eltec_features_data(links: Iterable[str] | None = None) -> Iterator[dict]:
-    """Retrieve data from a remote ELTeC features repo."""
+    """Retrieve data from a remote ELTeC features repo.
+
+    Feature files get fetched concurrently; executor.map preserves the order of links.
+    """
     _links = _get_eltec_features_links() if links is None else links
-    for link in _links:
-        _temp_file, _ = urlretrieve(link)
-        with open(_temp_file) as f:
-            feature_data = json.load(f)
+
+    with ThreadPoolExecutor() as executor:
+        for feature_data in executor.map(_get_feature_data, _links):
             yield from feature_data
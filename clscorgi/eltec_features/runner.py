@@ -17,8 +17,7 @@ def _generate_eltec_feature_graph() -> Graph:
 
     for bindings in feature_data:
         triples = ELTeCFeaturesRDFGenerator(**bindings)
-        for triple in triples:
-            graph.add(triple)
+        graph.addN((s, p, o, graph) for s, p, o in triples)
 
     return graph
 
@@ -28,5 +27,5 @@ def eltec_feature_runner() -> None:
     output_file = files("clscorgi.output.eltec_features") / "eltec_features.ttl"
     graph = _generate_eltec_feature_graph()
 
-    with open(output_file, "w") as f:
-        f.write(graph.serialize())
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        graph.serialize(destination=f, format="turtle", encoding="utf-8")
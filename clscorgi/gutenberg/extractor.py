@@ -1,21 +1,47 @@
 """API result generators for Gutendex."""
 
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from itertools import islice
 
-import requests
+import httpx
 from more_itertools import ichunked
+import orjson
+
+# pooled client: keep-alive connection reuse across Gutendex pages
+_client = httpx.Client(follow_redirects=True, timeout=30)
+
+
+def _get_gutendex_page(url: str) -> dict:
+    """Retrieve a single Gutendex result page."""
+    response = _client.get(url)
+    response.raise_for_status()
+
+    return orjson.loads(response.content)
 
 
 def get_gutendex_results(url: str = "https://gutendex.com/books/") -> Iterator[dict]:
-    """Generator for retrieving ALL Gutendex results."""
-    response = requests.get(url)
-    json_response = response.json()
+    """Generator for retrieving ALL Gutendex results.
+
+    Pages get followed iteratively; the next page is fetched
+    in the background while the results of the current page are consumed.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = _get_gutendex_page(url)
+
+        while True:
+            next_page = (
+                executor.submit(_get_gutendex_page, next_url)
+                if (next_url := page["next"]) is not None
+                else None
+            )
+
+            yield from page["results"]
 
-    yield from json_response["results"]
+            if next_page is None:
+                return
 
-    if (next_page := json_response["next"]) is not None:
-        yield from get_gutendex_results(url=next_page)
+            page = next_page.result()
 
 
 def get_gutendex_sliced_chunks(
@@ -17,6 +17,9 @@ def gutenberg_runner() -> None:
     cnt = count()
     output_dir = files("clscorgi.output.gutenberg")
 
+    # static triples: generate once, add to every chunk graph
+    e55_triples = tuple(e55_triple_generator())
+
     for data in get_gutendex_sliced_chunks():
         output_file = output_dir / f"gutenberg_{next(cnt)}.ttl"
 
@@ -27,14 +30,13 @@ def gutenberg_runner() -> None:
 
         triples = itertools.chain(
             main_triples,
-            e55_triple_generator()
+            e55_triples
         )
 
         graph = Graph()
         CLSInfraNamespaceManager(graph)
 
-        for triple in triples:
-            graph.add(triple)
+        graph.addN((s, p, o, graph) for s, p, o in triples)
 
-        with open(output_file, "w") as f:
-            f.write(graph.serialize())
+        with open(output_file, "wb", buffering=1 << 20) as f:
+            graph.serialize(destination=f, format="turtle", encoding="utf-8")
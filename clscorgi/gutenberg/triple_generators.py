@@ -1,6 +1,7 @@
 """Triple generators for the Gutenberg Corpus."""
 
 from collections.abc import Iterator
+from functools import lru_cache
 from itertools import chain
 
 from clisn import clscore, crm, crmcls, lrm
@@ -11,6 +12,9 @@ from rdflib.namespace import RDF, RDFS, XSD
 
 mkuri = mkuri_factory(clscore)
 
+_iso6391 = Namespace("https://vocabs.acdh.oeaw.ac.at/iso6391/")
+_language_uri = lru_cache(maxsize=None)(_iso6391.__getitem__)
+
 
 def lrm_boilerplate_triple_generator(
         bindings: GutenbergBindingsModel,
@@ -100,7 +104,7 @@ def x2_pg_triple_generator(
         )),
         (crm.P137_exemplifies, namespace.x11_gutenberg),
         (crm.P72_has_language, tuple(
-            Namespace("https://vocabs.acdh.oeaw.ac.at/iso6391/")[lang]
+            _language_uri(lang)
             for lang in bindings.languages
         )),
         (crm.P1_is_identified_by, [
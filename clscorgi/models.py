@@ -1,21 +1,21 @@
 """Pydantic models for RDFGenerator bindings validation."""
 
+import json
 import re
-from collections.abc import Iterator
-from typing import Annotated, Any, Literal
+from collections.abc import Callable, Iterator
+from importlib.resources import files
+from typing import Annotated, Any
 
-import lodkit.importer
-from pydantic import (AnyUrl, BaseModel, ConfigDict, Field, HttpUrl,
-                      ValidationError, ValidationInfo, field_validator,
-                      model_validator)
-from rdflib.namespace import RDFS
+from pydantic import (AfterValidator, AnyUrl, BaseModel, ConfigDict, Field,
+                      HttpUrl, ValidationError, ValidationInfo,
+                      field_validator, model_validator)
 
-from clscorgi.vocabs import identifier
-
-# better list cast here, else the iterator will likely be exhausted somewhere
+# rdfs:label terms of vocabs/identifier.ttl, see vocabs_utils.dump_id_types;
+# reading the JSON dump avoids parsing the vocab graph on import
 vocab_id_types: tuple[str, ...] = tuple(
-    map(str, identifier.objects(None, RDFS.label))
+    json.loads(files("clscorgi.vocabs").joinpath("_id_types.json").read_text())
 )
+vocab_id_types_set: frozenset[str] = frozenset(vocab_id_types)
 
 source_types: tuple[str, ...] = (
     "firstEdition",
@@ -23,6 +23,24 @@ source_types: tuple[str, ...] = (
     "digitalSource",
     "unspecified"
 )
+source_types_set: frozenset[str] = frozenset(source_types)
+
+
+def _member_of(values: frozenset[str]) -> Callable[[str | None], str | None]:
+    """Construct a validator callable for hashed set membership checks.
+
+    None values pass, nullability is expressed in the field annotation.
+    """
+    def _check(value: str | None) -> str | None:
+        if value is not None and value not in values:
+            raise ValueError(f"Value must be one of {sorted(values)}.")
+        return value
+
+    return _check
+
+
+_IDType = Annotated[str | None, AfterValidator(_member_of(vocab_id_types_set))]
+_SourceType = Annotated[str, AfterValidator(_member_of(source_types_set))]
 
 
 class _ELTeConlluStatsModel(BaseModel):
@@ -40,13 +58,13 @@ class ELTeCFeaturesBindingsModel(BaseModel):
 
 class IDMapping(BaseModel):
     """Simple model schema for IDMappings."""
-    id_type: Literal[vocab_id_types] | None  # type: ignore
+    id_type: _IDType
     id_value: str | None = None
 
 
 class SourceData(IDMapping):
     """Model schema for source data (tei:sourceDesc)."""
-    source_type: Literal[source_types]  # type: ignore
+    source_type: _SourceType
 
 
 class ELTeCBindingsModel(BaseModel):
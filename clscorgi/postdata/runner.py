@@ -2,6 +2,7 @@
 
 
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from importlib.resources import files
 from itertools import count, islice
 from pathlib import Path
@@ -11,7 +12,8 @@ from clscorgi.postdata.triple_extractor import \
     get_clscor_relevant_triples_from_graph
 from lodkit import _Triple
 from more_itertools import ichunked
-from rdflib import Graph
+from rdflib import Graph, Literal
+from rdflib.namespace import XSD
 
 
 def chunk_post_data_files() -> Iterator[Iterator]:
@@ -24,10 +26,38 @@ def chunk_post_data_files() -> Iterator[Iterator]:
     yield from ichunked(_postdata_ttl_files(), 200)
 
 
+def _plain_literal(triple: _Triple) -> _Triple:
+    """Turn explicit xsd:string literals into plain literals.
+
+    The Oxigraph parser types plain literals as xsd:string (RDF 1.1)
+    and has no option to keep them untyped, rdflib's own parser does not type them.
+    Normalizing keeps plain source literals plain in the serialized output;
+    note that literals explicitly typed ^^xsd:string in the source data
+    also end up as plain literals (rdflib's parser preserved those).
+    """
+    s, p, o = triple
+    if type(o) is Literal and o.datatype == XSD.string:
+        return s, p, Literal(str(o))
+    return triple
+
+
+def _extract_triples_from_file(path: Path) -> list[_Triple]:
+    """Parse a single Postdata file and extract CLSCor relevant triples.
+
+    Parsing is done by the Rust-based Oxigraph Turtle parser provided by oxrdflib.
+    """
+    graph = Graph().parse(path, format="ox-turtle")
+    return list(map(_plain_literal, get_clscor_relevant_triples_from_graph(graph)))
+
+
 def generate_triples_from_chunk(chunk: Iterator[Path]) -> Iterator[_Triple]:
-    for path in chunk:
-        graph = Graph().parse(path)
-        yield from get_clscor_relevant_triples_from_graph(graph)
+    """Generate CLSCor relevant triples from a chunk of Postdata files.
+
+    Files are independent, so parsing and extraction run in a process pool.
+    """
+    with ProcessPoolExecutor() as executor:
+        for triples in executor.map(_extract_triples_from_file, chunk):
+            yield from triples
 
 
 def generate_graph_from_chunk(chunk: Iterator[Path]) -> Graph:
@@ -36,8 +66,8 @@ def generate_graph_from_chunk(chunk: Iterator[Path]) -> Graph:
 
     print("INFO: Generating triples...")
 
-    for triple in generate_triples_from_chunk(chunk):
-        graph.add(triple)
+    triples = generate_triples_from_chunk(chunk)
+    graph.addN((s, p, o, graph) for s, p, o in triples)
 
     return graph
 
@@ -52,8 +82,8 @@ def postdata_runner() -> None:
         file_name = output_dir / f"postdata_{next(cnt)}.ttl"
         print(f"INFO: Materializing triples in {file_name.name}.")
 
-        with open(file_name, "w") as f:
-            f.write(graph.serialize())
+        with open(file_name, "wb", buffering=1 << 20) as f:
+            graph.serialize(destination=f, format="turtle", encoding="utf-8")
 
 
 if __name__ == "__main__":
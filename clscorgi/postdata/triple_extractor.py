@@ -1,6 +1,6 @@
 """Functionality for extracting CLSCor triples from Postdata graphs."""
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 
 from lodkit import _Triple
 from rdflib import BNode, Graph, Literal, Namespace, URIRef
@@ -17,26 +17,28 @@ postdata_namespaces: list[Namespace] = [
     for uri in _post_data_namespace_uris
 ]
 
+# str.startswith takes a tuple of prefixes, i.e. a single C-level call per URIRef;
+# note that rdflib's Identifier.startswith override does not support tuples
+_post_data_prefixes: tuple[str, ...] = tuple(_post_data_namespace_uris)
+
+
+# relevance checks indexed by exact component type: one dict lookup per component
+_relevance_checks: dict[type, Callable[[URIRef | Literal], bool]] = {
+    Literal: lambda component: True,
+    URIRef: lambda component: not str.startswith(component, _post_data_prefixes),
+}
+
 
 def _clscor_relevant_component_p(component: URIRef | Literal | BNode) -> bool:
-    match component:
-        case Literal():
-            return True
-        case URIRef():
-            return not any((component in ns) for ns in postdata_namespaces)
-        case _:
-            raise Exception("This should never happen.")
+    if (check := _relevance_checks.get(type(component))) is None:
+        raise Exception("This should never happen.")
+    return check(component)
 
 
 def _clscor_relevant_triple_p(triple: _Triple) -> bool:
-    return all(
-        _clscor_relevant_component_p(component)
-        for component in triple
-    )
+    return all(map(_clscor_relevant_component_p, triple))
 
 
 def get_clscor_relevant_triples_from_graph(graph: Graph) -> Iterator[_Triple]:
     """Extract CLSCor triples from a Graph object."""
-    for triple in graph.triples((None, None, None)):
-        if _clscor_relevant_triple_p(triple):
-            yield triple
+    return filter(_clscor_relevant_triple_p, graph.triples((None, None, None)))
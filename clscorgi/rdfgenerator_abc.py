@@ -15,27 +15,44 @@ class RDFGenerator(abc.ABC):
     def __init__(self,
                  model: type[BaseModel],
                  graph: RDFLibGraph | None = None,
+                 bindings_model: BaseModel | None = None,
                  **bindings: Any) -> None:
-        """Initialize an RDFGenerator."""
-        self.bindings = model(**bindings)
+        """Initialize an RDFGenerator.
+
+        Bindings are either passed as kwargs and validated against model
+        or passed as an already validated model instance (bindings_model).
+        """
+        if bindings_model is None:
+            self.bindings = model(**bindings)
+        elif isinstance(bindings_model, model):
+            self.bindings = bindings_model
+        else:
+            raise TypeError(
+                f"bindings_model must be an instance of '{model.__name__}'."
+            )
 
         self._triples = self.generate_triples()
-        self._graph = RDFLibGraph() if graph is None else graph
+        self._graph = graph
 
     def to_graph(self):
         """Add triples to an rdflib.Graph instance and return."""
-        for triple in self._triples:
-            self._graph.add(triple)
+        graph = self.graph
+        graph.addN((s, p, o, graph) for s, p, o in self._triples)
 
-        return self._graph
+        return graph
 
     @property
     def graph(self):
         """Getter for the rdflib.Graph component.
 
+        The Graph only gets created on first access, runners that just iterate
+        over an RDFGenerator never pay for a per-instance Graph/store.
         For updating (i.e. adding triples to) the Graph component,
         run the RDFGenerator.to_graph method.
         """
+        if self._graph is None:
+            self._graph = RDFLibGraph()
+
         return self._graph
 
     @abc.abstractmethod
@@ -52,11 +52,93 @@ class ELTeCFeaturesRDFGenerator(RDFGenerator):
         return e13_eltec_features_generator(self.bindings)
 
 class ELTeCRDFGenerator(RDFGenerator):
-    """CLSCor RDFGenerator for ELTeC corpora."""
-
-    def __init__(self, *args, **kwargs):
+    """CLSCor RDFGenerator for ELTeC corpora.
+
+    Corpus-level triples (X1, X8, schema and E55 type assertions) are the same
+    for every work of a repo; pass include_corpus_triples=False and emit them once
+    per repo with ELTeCRDFGenerator.generate_corpus_triples instead.
+    """
+
+    schema_level1: str = (
+        "https://raw.githubusercontent.com/COST-ELTeC/"
+        "Schemas/master/eltec-1.rng"
+    )
+
+    # constant URIs, computed once instead of per work
+    schema_uri: URIRef = mkuri(schema_level1)
+    x1_eltec_uri: URIRef = mkuri("ELTeC [X1]")
+    x8_uri: URIRef = mkuri("ELTeC Level 1 Schema")
+    e55_eltec_title_uri: URIRef = mkuri("ELTeC Title")
+    e55_eltec_id_uri: URIRef = mkuri("ELTeC ID")
+    e55_eltec_id_url_uri: URIRef = mkuri("ELTeC ID URL [E55]")
+    e55_eltec_author_name_uri: URIRef = mkuri("ELTeC Author Name")
+    tei_format_uri: URIRef = vocab("TEI")
+
+    def __init__(self, *args, include_corpus_triples: bool = True, **kwargs):
+        self.include_corpus_triples = include_corpus_triples
         super().__init__(*args, model=ELTeCBindingsModel, **kwargs)
 
+    @classmethod
+    def generate_corpus_triples(cls, repo_id: str) -> Iterator[_Triple]:
+        """Generate the repo-constant triples for an ELTeC corpus."""
+        x1_uri: URIRef = mkuri(repo_id)
+        x1_eltec_uri: URIRef = cls.x1_eltec_uri
+        x8_uri: URIRef = cls.x8_uri
+        schema_uri: URIRef = cls.schema_uri
+
+        x1_triples = ttl(
+            x1_uri,
+            (RDF.type, crmcls.X1_Corpus),
+            (crm.P1_is_identified_by, ttl(
+                mkuri(f"{repo_id} [X1 Appellation]"),
+                (RDF.type, crm.E41_Appellation),
+                (RDF.value, Literal(f"ELTeC {repo_id.split('-')[1].upper()}"))
+            )),
+            (crmcls.Y4i_is_subcorpus_of, x1_eltec_uri)
+        )
+
+        x1_eltec_triples = ttl(
+            x1_eltec_uri,
+            (RDF.type, crmcls.X1_Corpus),
+            (crmcls.Y4_has_subcorpus, x1_uri)
+        )
+
+        x8_triples = ttl(
+            x8_uri,
+            (RDF.type, crmcls.X8_Schema),
+            (RDFS.label, Literal("ELTeC Level 1 RNG Schema")),
+            (crm.P1_is_identified_by, schema_uri)
+        )
+
+        eltec_schema_triples = ttl(
+            schema_uri,
+            (RDF.type, crm.E42_Identifier),
+            (RDFS.label, Literal("Link to ELTeC Level 1 RNG Schema")),
+            (crm.P190_has_symbolic_content, Literal(cls.schema_level1))
+        )
+
+        e55_triples = itertools.chain.from_iterable(
+            ttl(
+                e55_uri,
+                (RDF.type, crm.E55_Type),
+                (RDFS.label, Literal(label))
+            )
+            for e55_uri, label in (
+                (cls.e55_eltec_title_uri, "ELTeC Work Title"),
+                (cls.e55_eltec_id_uri, "ELTeC Corpus Document ID"),
+                (cls.e55_eltec_id_url_uri, "ELTeC Document ID URL"),
+                (cls.e55_eltec_author_name_uri, "ELTeC Author Name"),
+            )
+        )
+
+        return itertools.chain(
+            x1_triples,
+            x1_eltec_triples,
+            x8_triples,
+            eltec_schema_triples,
+            e55_triples
+        )
+
     def generate_triples(self) -> Iterator[_Triple]:
         """Generate triples from an ELTeC resource."""
         work_ids: dict[URIRef, SourceData] = {
@@ -74,9 +156,17 @@ class ELTeCRDFGenerator(RDFGenerator):
             for _id in self.bindings.author_ids
         }
 
+        author_e42_uris: dict[URIRef, URIRef] = {
+            author_uri: mkuri(f"{author_id.id_value} [E42]")
+            for author_uri, author_id in author_ids.items()
+        }
+
+        work_title: str = self.bindings.work_title
+        author_name: str = self.bindings.author_name
+
         uris: SimpleNamespace = uri_ns(
             "e39", "e35",
-            ("e39_e41", f"{self.bindings.author_name} [E41]"),
+            ("e39_e41", f"{author_name} [E41]"),
             "x2_e42",
             ("x2", f"{self.bindings.resource_uri} [X2]"),
             ("x1_eltec", "ELTeC [X1]"),
@@ -84,97 +174,80 @@ class ELTeCRDFGenerator(RDFGenerator):
             "f1", "f2", "f3", "f27", "f28"
         )
 
-        # todo: singleton (type)
-        schema_level1: str = (
-            "https://raw.githubusercontent.com/COST-ELTeC/"
-            "Schemas/master/eltec-1.rng"
+        # bind URIs to locals once: the ttl blocks below reference them repeatedly
+        e39, e35, e39_e41, x2_e42, x2 = (
+            uris.e39, uris.e35, uris.e39_e41, uris.x2_e42, uris.x2
         )
-        schema_uri: URIRef = mkuri(schema_level1)
-
-        e55_eltec_title_uri: URIRef = mkuri("ELTeC Title")
-        e55_eltec_id_uri: URIRef = mkuri("ELTeC ID")
-        e55_eltec_author_name_uri: URIRef = mkuri("ELTeC Author Name")
+        x1_eltec, x11_eltec = uris.x1_eltec, uris.x11_eltec
+        f1, f2, f27, f28 = uris.f1, uris.f2, uris.f27, uris.f28
 
         x1_uri: URIRef = mkuri(self.bindings.repo_id)
-        x8_uri: URIRef = mkuri("ELTeC Level 1 Schema")
 
         f1_triples = ttl(
-            uris.f1,
+            f1,
             (RDF.type, lrm.F1_Work),
-            (RDFS.label, Literal(f"{self.bindings.work_title} [Work]")),
-            (lrm.R16i_was_created_by, uris.f27),
-            (lrm.R3_is_realised_in, uris.f2),
-            (lrm.R74i_has_expression_used_in, uris.f1)
+            (RDFS.label, Literal(f"{work_title} [Work]")),
+            (lrm.R16i_was_created_by, f27),
+            (lrm.R3_is_realised_in, f2)
         )
 
         f2_triples = ttl(
-            uris.f2,
+            f2,
             (RDF.type, lrm.F2_Expression),
-            (RDFS.label, Literal(f"{self.bindings.work_title} [Expression]")),
-            (crm.P102_has_title, uris.e35),
-            (lrm.R3i_realises, uris.f1),
-            (lrm.R17i_was_created_by, uris.f28),
-            (lrm.R4i_is_embodied_in, (uris.x2, *f3_uris))  # and f3s (todo)
+            (RDFS.label, Literal(f"{work_title} [Expression]")),
+            (crm.P102_has_title, e35),
+            (lrm.R3i_realises, f1),
+            (lrm.R17i_was_created_by, f28),
+            (lrm.R4i_is_embodied_in, (x2, *f3_uris))  # and f3s (todo)
         )
 
         x1_triples = ttl(
             x1_uri,
-            (RDF.type, crmcls.X1_Corpus),
-            (crm.P1_is_identified_by, ttl(
-                mkuri(f"{self.bindings.repo_id} [X1 Appellation]"),
-                (RDF.type, crm.E41_Appellation),
-                (RDF.value, Literal(f"ELTeC {self.bindings.repo_id.split('-')[1].upper()}"))
-            )),
-            (lrm.R71_has_part, uris.x2),
-            (crmcls.Y4i_is_subcorpus_of, uris.x1_eltec)
+            (lrm.R71_has_part, x2)
         )
 
         x1_eltec_triples = ttl(
-            uris.x1_eltec,
-            (RDF.type, crmcls.X1_Corpus),
-            (crmcls.Y4_has_subcorpus, x1_uri),
+            x1_eltec,
             # X1 -> P148 -> X2
-            (crm.P148_has_component, uris.x2)
+            (crm.P148_has_component, x2)
         )
 
         x2_triples = ttl(
-            uris.x2,
+            x2,
             (RDF.type, crmcls.X2_Corpus_Document),
-            (RDFS.label, Literal(f"{self.bindings.work_title} [TEI Document]")),
-            (crm.P1_is_identified_by, uris.x2_e42),
-            (lrm.R4_embodies, uris.f2),
+            (RDFS.label, Literal(f"{work_title} [TEI Document]")),
+            (crm.P1_is_identified_by, x2_e42),
+            (lrm.R4_embodies, f2),
             (lrm.R71i_is_part_of, x1_uri),
-            (crmcls.Y2_has_format, vocab("TEI")),
-            (crmcls.Y3_adheres_to_schema, x8_uri),
+            (crmcls.Y2_has_format, self.tei_format_uri),
+            (crmcls.Y3_adheres_to_schema, self.x8_uri),
             # X2 -> P137 -> X11
-            (crm.P137_exemplifies, uris.x11_eltec),
+            (crm.P137_exemplifies, x11_eltec),
             (crm.P1_is_identified_by, [
                 (RDF.type, crm.E42_Identifier),
-                (RDFS.label, Literal(f"{self.bindings.work_title} [ELTeC ID URL]")),
+                (RDFS.label, Literal(f"{work_title} [ELTeC ID URL]")),
                 (crm.P190_has_symbolic_content, Literal(f"{self.bindings.resource_uri}")),
-                (crm.P2_has_type, ttl(
-                    mkuri("ELTeC ID URL [E55]"),
-                    (RDF.type, crm.E55_Type),
-                    (RDFS.label, Literal("ELTeC Document ID URL"))
-                ))
+                (crm.P2_has_type, self.e55_eltec_id_url_uri)
             ])
         )
 
         x2_e42_triples = ttl(
-            uris.x2_e42,
+            x2_e42,
             (RDF.type, crm.E42_Identifier),
-            (RDFS.label, Literal(f"{self.bindings.work_title} [ELTeC ID]")),
+            (RDFS.label, Literal(f"{work_title} [ELTeC ID]")),
             (crm.P190_has_symbolic_content, Literal(f"{self.bindings.file_stem}")),
-            (crm.P2_has_type, e55_eltec_id_uri)
+            (crm.P2_has_type, self.e55_eltec_id_uri)
         )
 
         def work_id_triples() -> Iterator[_Triple]:
             """Triple iterator for work ID E42 assertions."""
+            work_id_label = Literal(f"{work_title} [ID]")
+
             for e42_uri, work_data in work_ids.items():
                 triples = ttl(
                     e42_uri,
                     (RDF.type, crm.E42_Identifier),
-                    (RDFS.label, Literal(f"{self.bindings.work_title} [ID]")),
+                    (RDFS.label, work_id_label),
                     (crm.P190_has_symbolic_content, Literal(f"{work_data.id_value}"))
                 )
 
@@ -190,16 +263,15 @@ class ELTeCRDFGenerator(RDFGenerator):
 
         def f3_triples() -> Iterator[_Triple]:
             """Triple iterator for F3 generation based on work_ids."""
+            f3_label = Literal(f"{work_title} [Manifestation]")
+
             for f3_uri, (e42_uri, work_data) in zip(f3_uris, work_ids.items()):
                 f3_triples = ttl(
                     f3_uri,
                     (RDF.type, lrm.F3_Manifestation),
-                    (
-                        RDFS.label,
-                        Literal(f"{self.bindings.work_title} [Manifestation]")
-                    ),
+                    (RDFS.label, f3_label),
                     (crm.P1_is_identified_by, e42_uri),
-                    (lrm.R4_embodies, uris.f2),
+                    (lrm.R4_embodies, f2),
                 )
 
                 with suppress(VocabLookupException):
@@ -216,67 +288,61 @@ class ELTeCRDFGenerator(RDFGenerator):
                 yield from f3_triples
 
         x8_triples = ttl(
-            x8_uri,
-            (RDF.type, crmcls.X8_Schema),
-            (RDFS.label, Literal("ELTeC Level 1 RNG Schema")),
-            (crm.P1_is_identified_by, schema_uri),
-            (crmcls.Y3i_is_schema_of, uris.x2)
+            self.x8_uri,
+            (crmcls.Y3i_is_schema_of, x2)
         )
 
         f27_triples = ttl(
-            uris.f27,
+            f27,
             (RDF.type, lrm.F27_Work_Creation),
-            (RDFS.label, Literal(f"{self.bindings.work_title} [Work Creation]")),
-            (crm.P14_carried_out_by, uris.e39),
-            (lrm.R16_created, uris.f1)
+            (RDFS.label, Literal(f"{work_title} [Work Creation]")),
+            (crm.P14_carried_out_by, e39),
+            (lrm.R16_created, f1)
         )
 
         f28_triples = ttl(
-            uris.f28,
+            f28,
             (RDF.type, lrm.F28_Expression_Creation),
             (
                 RDFS.label,
-                Literal(f"{self.bindings.work_title} [Expression Creation]")
+                Literal(f"{work_title} [Expression Creation]")
             ),
-            (crm.P14_carried_out_by, uris.e39),
-            (lrm.R17_created, uris.f2),
+            (crm.P14_carried_out_by, e39),
+            (lrm.R17_created, f2),
             (crm.P82_at_some_time_within, Literal(f"{self.bindings.date}"))
         )
 
         e35_triples = ttl(
-            uris.e35,
+            e35,
             (RDF.type, crm.E35_Title),
-            (crm.P102i_is_title_of, uris.f2),
-            (crm.P2_has_type, e55_eltec_title_uri),
+            (crm.P102i_is_title_of, f2),
+            (crm.P2_has_type, self.e55_eltec_title_uri),
             (
                 RDFS.label,
-                Literal(f"{self.bindings.work_title} [Title of Expression]")
+                Literal(f"{work_title} [Title of Expression]")
             ),
             (
                 crm.p190_has_symbolic_content,
-                Literal(f"{self.bindings.work_title}")
+                Literal(work_title)
             )
         )
 
         def e39_triples() -> Iterator[_Triple]:
             """E39 triple generator."""
             first_id, *rest_ids = (
-                mkuri(self.bindings.author_name),
+                mkuri(author_name),
                 *author_ids.keys()
             )
 
-            e42_uris = (
-                mkuri(f"{author_id.id_value} [E42]")
-                for _, author_id in author_ids.items()
-            )
+            e42_uris = author_e42_uris.values()
 
             e39_triples = ttl(
                 first_id,
                 (RDF.type, crm.E39_Actor),
-                (RDFS.label, Literal(f"{self.bindings.author_name} [Actor]")),
-                (crm.P14i_performed, (uris.f27, uris.f28)),
+                (RDFS.label, Literal(f"{author_name} [Actor]")),
+                (crm.P14i_performed, (f27, f28)),
                 # create e41s based on author ids(todo)
-                (crm.P1_is_identified_by, (uris.e39_e41, *e42_uris))
+                (crm.P1_is_identified_by, (e39_e41, *e42_uris))
             )
 
             e39_same_as = (
@@ -288,24 +354,26 @@ class ELTeCRDFGenerator(RDFGenerator):
             yield from e39_same_as
 
         e39_e41_triples = ttl(
-            uris.e39_e41,
+            e39_e41,
             (RDF.type, crm.E41_Appellation),
             (RDFS.label, Literal("ELTeC Author Name [Appellation]")),
             (
                 crm.P190_has_symbolic_content,
-                Literal(f"{self.bindings.author_name} [ELTeC Author Name]")
+                Literal(f"{author_name} [ELTeC Author Name]")
             ),
-            (crm.P2_has_type, e55_eltec_author_name_uri),
-            (crm.P1i_identifies, uris.e39)
+            (crm.P2_has_type, self.e55_eltec_author_name_uri),
+            (crm.P1i_identifies, e39)
         )
 
         def e39_e42_triples() -> Iterator[_Triple]:
-            for _, author_id in author_ids.items():
-                e42_uri = mkuri(f"{author_id.id_value} [E42]")
+            author_id_label = Literal(f"{author_name} [ID]")
+
+            for author_uri, author_id in author_ids.items():
+                e42_uri = author_e42_uris[author_uri]
                 e42_triples = ttl(
                     e42_uri,
                     (RDF.type, crm.E42_Identifier),
-                    (RDFS.label, Literal(f"{self.bindings.author_name} [ID]")),
+                    (RDFS.label, author_id_label),
                     (crm.P190_has_symbolic_content, Literal(f"{author_id.id_value}"))
                 )
 
@@ -319,35 +387,25 @@ class ELTeCRDFGenerator(RDFGenerator):
 
                 yield from e42_triples
 
-        # todo: singleton (type)
         e55_eltec_title_triples = ttl(
-            e55_eltec_title_uri,
-            (RDF.type, crm.E55_Type),
-            (RDFS.label, Literal("ELTeC Work Title")),
-            (crm.P2i_is_type_of, uris.e35)
-        )
-
-        # todo: singleton (type)
-        eltec_schema_triples = ttl(
-            schema_uri,
-            (RDF.type, crm.E42_Identifier),
-            (RDFS.label, Literal("Link to ELTeC Level 1 RNG Schema")),
-            (crm.P190_has_symbolic_content, Literal(schema_level1))
+            self.e55_eltec_title_uri,
+            (crm.P2i_is_type_of, e35)
         )
 
-        # todo: singleton (type)
         e55_eltec_id_triples = ttl(
-            e55_eltec_id_uri,
-            (RDF.type, crm.E55_Type),
-            (RDFS.label, Literal("ELTeC Corpus Document ID")),
-            (crm.P2i_is_type_of, uris.x2_e42)
+            self.e55_eltec_id_uri,
+            (crm.P2i_is_type_of, x2_e42)
         )
 
         e55_eltec_author_name_triples = ttl(
-            e55_eltec_author_name_uri,
-            (RDF.type, crm.E55_Type),
-            (RDFS.label, Literal("ELTeC Author Name")),
-            (crm.P2i_is_type_of, uris.e39_e41)
+            self.e55_eltec_author_name_uri,
+            (crm.P2i_is_type_of, e39_e41)
+        )
+
+        corpus_triples = (
+            self.generate_corpus_triples(self.bindings.repo_id)
+            if self.include_corpus_triples
+            else ()
         )
 
         triples = itertools.chain(
@@ -368,8 +426,8 @@ class ELTeCRDFGenerator(RDFGenerator):
             e55_eltec_title_triples,
             e55_eltec_id_triples,
             e55_eltec_author_name_triples,
-            eltec_schema_triples,
-            work_id_triples()
+            work_id_triples(),
+            corpus_triples
         )
 
         return triples
@@ -394,11 +452,9 @@ class ReMRDFGenerator(RDFGenerator):
         )
 
         uris = generate_uri_namespace()
-        triples = itertools.chain.from_iterable(
-            map(lambda f: f(self.bindings, uris), triple_generators)
-        )
 
-        return triples
+        for triple_generator in triple_generators:
+            yield from triple_generator(self.bindings, uris)
 
 
 class GutenbergRDFGenerator(RDFGenerator):
@@ -426,11 +482,8 @@ class GutenbergRDFGenerator(RDFGenerator):
             x2_pg_triple_generator
         )
 
-        triples = itertools.chain.from_iterable(
-            map(lambda f: f(self.bindings, namespace), triple_generators)
-        )
-
-        return triples
+        for triple_generator in triple_generators:
+            yield from triple_generator(self.bindings, namespace)
 
 
 class DLKRDFGenerator(RDFGenerator):
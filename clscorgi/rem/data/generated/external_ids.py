@@ -3,52 +3,43 @@
 import json
 
 from collections.abc import Callable
-from functools import reduce
+from concurrent.futures import ProcessPoolExecutor
 from importlib.resources import files
-from os import PathLike
-from pathlib import Path, PosixPath
+from pathlib import Path
 
-from functools import reduce
-from rdflib import Graph
+from clisn import crm
+from rdflib import Graph, Namespace, URIRef
+from rdflib.namespace import OWL, RDF
 
+# legacy ReM graphs use FRBRoo instead of LRMoo
+frbroo = Namespace("http://iflastandards.info/ns/fr/frbr/frbroo/")
 
-def _get_query_template(crm_class):
-    query_template = (
-        "select distinct ?id1 ?id2"
-        "where {"
-        "?s ?p ?o ; "
-        f"a {crm_class} . "
-        "optional {?s owl:sameAs ?id1}"
-        "optional {?s rdfs:seeAlso ?id2}"
-        "}"
-    )
 
-    return query_template
-
-
-def _get_external_id_factory(crm_class) -> Callable[[Graph], list | None]:
-    template = _get_query_template(crm_class)
+def _get_external_id_factory(crm_class: URIRef) -> Callable[[Graph], list | None]:
+    """Construct an extractor for the owl:sameAs IDs of crm_class instances.
 
+    Instances and their IDs are looked up directly in the graph's triple index.
+    Note: the former SPARQL query only ever bound owl:sameAs
+    (a missing space turned ?id2 into ?id2where), so rdfs:seeAlso is not extracted.
+    """
     def _wrapper(graph: Graph):
-        query_results = graph.query(template)
         result = [
-            str(unification)
-            for query_result in query_results
-            for unification in query_result
-            if unification is not None
+            str(external_id)
+            for subject in graph.subjects(RDF.type, crm_class)
+            for external_id in graph.objects(subject, OWL.sameAs)
         ] or None
 
         return result
     return _wrapper
 
 
-_get_work_ids = _get_external_id_factory("frbroo:F1_Work")
-_get_author_ids = _get_external_id_factory("crm:E39_Actor")
+_get_work_ids = _get_external_id_factory(frbroo.F1_Work)
+_get_author_ids = _get_external_id_factory(crm.E39_Actor)
 
 
 def _graph_extractor(graph_file: Path) -> dict:
     rem_id = graph_file.stem
-    graph = Graph().parse(graph_file)
+    graph = Graph().parse(graph_file, format="ox-turtle")
 
     author_ids = _get_author_ids(graph)
     work_ids = _get_work_ids(graph)
@@ -67,11 +58,11 @@ if __name__ == "__main__":
     graph_dir = files("clscorgi.rem.data.graphs")
     output_file = files("clscorgi.rem.data.generated") / "external_ids.json"
 
-    graph_data = reduce(
-        lambda d, data: d | data,
-        map(_graph_extractor, graph_dir.iterdir()),
-        dict()
-    )
+    # graph files are independent, so parse and extract in separate processes
+    graph_data: dict = {}
+    with ProcessPoolExecutor() as executor:
+        for data in executor.map(_graph_extractor, graph_dir.iterdir(), chunksize=8):
+            graph_data.update(data)
 
     with open(output_file, "w") as f:
         json.dump(graph_data, f, indent=4)
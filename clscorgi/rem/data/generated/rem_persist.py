@@ -1,8 +1,10 @@
 """Script for extracting and persisting ReM data as JSON."""
 
 import json
-
+from concurrent.futures import ProcessPoolExecutor
 from importlib.resources import files
+from pathlib import Path
+
 from clscorgi.rem.extractors.bindings_extractors import ReMBindingsExtractor
 
 
@@ -10,12 +12,18 @@ xml_dir = files("clscorgi.rem.data.headers")
 data_file = files("clscorgi.rem.data.generated") / "rem.json"
 
 
+def _extract_bindings(xml_file: Path) -> dict:
+    """Extract bindings from a single ReM header file."""
+    return ReMBindingsExtractor(xml_file).data
+
+
 if __name__ == "__main__":
-    bindings = [
-        dict(ReMBindingsExtractor(xml_file))
-        for xml_file
-        in xml_dir.iterdir()
-    ]
+    # header parsing and XPath extraction are CPU-bound, so use processes;
+    # executor.map keeps the order of xml_dir.iterdir
+    with ProcessPoolExecutor() as executor:
+        bindings = list(
+            executor.map(_extract_bindings, xml_dir.iterdir(), chunksize=16)
+        )
 
     with open(data_file, "w") as f:
         json.dump(bindings, f, indent=4)
@@ -10,12 +10,26 @@ from clscorgi.rem.extractors.tree_extractors import (get_genre, get_id,
                                                      get_source, get_title,
                                                      get_token)
 from clscorgi.utils.utils import revalmap
-from lxml import etree
-from toolz import compose, valmap
 
-value_sanitizer = compose(
-    lambda x: None if x in ("-", "NA", "") else x
-)
+# placeholder values in ReM headers
+_sentinels: frozenset[str] = frozenset({"-", "NA", ""})
+
+
+def value_sanitizer(value):
+    """Map ReM placeholder values to None."""
+    return None if value in _sentinels else value
+
+
+_bindings_mapping: dict[str, Callable] = {
+    "id": get_id,
+    "title": get_title,
+    "genre": get_genre,
+    "token_count": get_token,
+    "resource_url": get_resource_url,
+    "publication": get_publication,
+    "source": get_source,
+}
+
 
 class ReMBindingsExtractor(BindingsExtractor):
     def __init__(self, header_path: Path):
@@ -23,18 +37,11 @@ class ReMBindingsExtractor(BindingsExtractor):
         super().__init__()
 
     def generate_bindings(self) -> dict:
-        tree = etree.parse(self.header_path)
-
-        _bindings_mapping: dict[str, Callable] = {
-            "id": get_id,
-            "title": get_title,
-            "genre": get_genre,
-            "token_count": get_token,
-            "resource_url": get_resource_url,
-            "publication": get_publication,
-            "source": get_source,
-        }
+        tree = self._parse_tree(self.header_path)
 
-        _bindings = valmap(lambda x: x(tree), _bindings_mapping)
+        _bindings = {
+            key: extractor(tree)
+            for key, extractor in _bindings_mapping.items()
+        }
         bindings = revalmap(value_sanitizer, _bindings)
         return bindings
@@ -1,50 +1,56 @@
 """Tree/XPath exractor functions"""
 
-from collections.abc import Callable, Sequence
-from functools import partial
-from importlib.resources import files
-from pathlib import Path
-from typing import Any
-
-from clscorgi.utils.utils import first
 from lxml import etree
 
-TEIXPath = partial(
-    etree.XPath,
-    namespaces={"tei": "http://www.tei-c.org/ns/1.0"}
-)
+_namespaces: dict[str, str] = {"tei": "http://www.tei-c.org/ns/1.0"}
+_xml_id: str = "{http://www.w3.org/XML/1998/namespace}id"
+
+
+def _find_text(element: etree._Element | etree._ElementTree, path: str) -> str | None:
+    """Return the text of the first element matching an ElementPath.
+
+    Unlike //-XPaths, find stops at the first hit instead of scanning the whole tree.
+    """
+    return element.findtext(path, namespaces=_namespaces)
 
-def xpath_factory(xpath: str) -> Callable[[etree._ElementTree], Any]:
-    def _wrapper(tree: etree._ElementTree):
-        result = TEIXPath(xpath)(tree)
-        return first(result)
-    return _wrapper
+
+def _find_attribute(
+        element: etree._Element | etree._ElementTree,
+        path: str,
+        attribute: str
+) -> str | None:
+    """Return an attribute value of the first element matching an ElementPath."""
+    match = element.find(path, namespaces=_namespaces)
+    return None if match is None else match.get(attribute)
 
 
 def get_publication(tree: etree._ElementTree) -> dict:
-    _publication_stmt = xpath_factory("//tei:publicationStmt")(tree)
-    idno = xpath_factory("tei:idno/text()")(_publication_stmt)
-    date = xpath_factory("tei:date/@when")(_publication_stmt)
+    _publication_stmt = tree.find(".//tei:publicationStmt", namespaces=_namespaces)
+    idno = _find_text(_publication_stmt, "tei:idno")
+    date = _find_attribute(_publication_stmt, "tei:date", "when")
 
     return {
         "idno": idno,
         "date": date
     }
 
+
 def get_source(tree: etree._ElementTree) -> dict:
-    _ms_desc = xpath_factory("//tei:sourceDesc/tei:msDesc")(tree)
-    _ms_identifier = xpath_factory("tei:msIdentifier")(_ms_desc)
-    _history = xpath_factory("tei:history/tei:origin")(_ms_desc)
+    _ms_desc = tree.find(".//tei:sourceDesc/tei:msDesc", namespaces=_namespaces)
+    _ms_identifier = _ms_desc.find("tei:msIdentifier", namespaces=_namespaces)
+    _history = _ms_desc.find("tei:history/tei:origin", namespaces=_namespaces)
 
-    msname = xpath_factory("tei:msName/text()")(_ms_identifier)
-    repo = xpath_factory("tei:altIdentifier/tei:repository/text()")(_ms_identifier)
-    idno = xpath_factory("tei:altIdentifier/tei:idno/text()")(_ms_identifier)
+    msname = _find_text(_ms_identifier, "tei:msName")
+    repo = _find_text(_ms_identifier, "tei:altIdentifier/tei:repository")
+    idno = _find_text(_ms_identifier, "tei:altIdentifier/tei:idno")
 
-    object_type = xpath_factory("tei:objectType/text()")(_history)
-    census_link = xpath_factory("//tei:recordHist/tei:source/tei:ref/@target")(tree)
+    object_type = _find_text(_history, "tei:objectType")
+    census_link = _find_attribute(
+        tree, ".//tei:recordHist/tei:source/tei:ref", "target"
+    )
 
-    tpq = xpath_factory("tei:origDate/@notBefore-custom")(_history)
-    taq = xpath_factory("tei:origDate/@notAfter-custom")(_history)
+    tpq = _find_attribute(_history, "tei:origDate", "notBefore-custom")
+    taq = _find_attribute(_history, "tei:origDate", "notAfter-custom")
 
     return {
         "msname": msname,
@@ -59,10 +65,25 @@ def get_source(tree: etree._ElementTree) -> dict:
     }
 
 
-get_id = xpath_factory("//tei:fileDesc/@xml:id")
-get_title = xpath_factory("//tei:titleStmt/tei:title/text()")
-get_genre = xpath_factory("//tei:teiHeader/@style")
-get_token = xpath_factory("//tei:fileDesc/tei:extent[@type='Tokens']/text()")
+def get_id(tree: etree._ElementTree) -> str | None:
+    """Get the xml:id of the tei:fileDesc element."""
+    return _find_attribute(tree, ".//tei:fileDesc", _xml_id)
+
+
+def get_title(tree: etree._ElementTree) -> str | None:
+    """Get the tei:titleStmt title text."""
+    return _find_text(tree, ".//tei:titleStmt/tei:title")
+
+
+def get_genre(tree: etree._ElementTree) -> str | None:
+    """Get the genre from the tei:teiHeader style attribute."""
+    return _find_attribute(tree, ".//tei:teiHeader", "style")
+
+
+def get_token(tree: etree._ElementTree) -> str | None:
+    """Get the token count from the tei:extent[@type='Tokens'] text."""
+    return _find_text(tree, ".//tei:fileDesc/tei:extent[@type='Tokens']")
+
 
 def get_resource_url(tree: etree._ElementTree) -> str:
     """Construct resource URL based on a tree."""
@@ -1,27 +1,29 @@
 """ReM runner: Main entry point for ReM conversions."""
 
-import json
-
 from collections.abc import Iterator
 from itertools import chain
 from importlib.resources import files
 
+from pydantic import TypeAdapter
 from rdflib import Graph
 from clisn import CLSInfraNamespaceManager
 from lodkit import _Triple
 
+from clscorgi.models import ReMBindingsModel
 from clscorgi.rdfgenerators import ReMRDFGenerator
 from clscorgi.rem.triple_generators import e55_triples
 
+_bindings_adapter = TypeAdapter(list[ReMBindingsModel])
+
 
 def _generate_triples() -> Iterator[_Triple]:
     data_file = files("clscorgi.rem.data.generated") / "rem.json"
 
-    with open(data_file) as f:
-        data = json.load(f)
+    with open(data_file, "rb") as f:
+        data = _bindings_adapter.validate_json(f.read())
 
     main_triples: Iterator[_Triple] = chain.from_iterable(
-        ReMRDFGenerator(**bindings)
+        ReMRDFGenerator(bindings_model=bindings)
         for bindings in data
     )
 
@@ -36,8 +38,7 @@ def rem_runner() -> None:
     graph = Graph()
     CLSInfraNamespaceManager(graph)
 
-    for triple in triples:
-        graph.add(triple)
+    graph.addN((s, p, o, graph) for s, p, o in triples)
 
-    with open(output_file, "w") as f:
-        f.write(graph.serialize())
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        graph.serialize(destination=f, format="turtle", encoding="utf-8")
@@ -21,19 +21,38 @@ e55_pairs: tuple[tuple[str, str]] = (
 
 mkuri = mkuri_factory(crmcls)
 
+_tei_format_uri = URIRef("https://clscor.io/entity/type/format/tei")
+_token_feature_uri = URIRef("https://clscor.io/entity/type/feature/token")
+_wikidata_genre_uri = URIRef("https://www.wikidata.org/entity/Q483394")
+
+
+# hashed URIs are the same for every document, so they only get generated once
+_static_names: tuple[tuple[str, str], ...] = (
+    ("x1_rem", "ReM [X1]"),
+    ("x11_rem", "ReM [X11]"),
+    *e55_pairs
+)
+_static_uris = URINamespace(namespace=clscore, names=_static_names)
+
 
 def generate_uri_namespace() -> URINamespace:
+    """Generate a URI namespace for a single ReM document.
+
+    Only the per-document (UUID) URIs are generated on each call,
+    static URIs are bound from the module-level namespace.
+    """
     uris = URINamespace(
         namespace=clscore,
         names=(
             "f1", "f2", "x2", "f3pub", "f3src", "f5",
             "f27", "f28", "f30_x2", "f30_f3pub", "f30_f3src", "f32",
             "e17", "e35", "e52",
-            ("x1_rem", "ReM [X1]"),
-            ("x11_rem", "ReM [X11]"),
-            *e55_pairs
         )
     )
+
+    for name, _ in _static_names:
+        setattr(uris, name, getattr(_static_uris, name))
+
     return uris
 
 
@@ -98,7 +117,7 @@ def x2_triple_generator(
             (crm.P148_has_component, uris.x2)
         )),
         (crm.P137_exemplifies, ttl(uris.x11_rem, (RDF.type, crmcls.X11_Prototypical_Document))),
-        (crmcls.Y2_has_format, URIRef("https://clscor.io/entity/type/format/tei"))
+        (crmcls.Y2_has_format, _tei_format_uri)
     )
 
     e13_feature_triples = ttl(
@@ -110,7 +129,7 @@ def x2_triple_generator(
         (crm.P141_assigned, ttl(
             mkuri(),
             (RDF.type, crmcls.X3_Feature),
-            (crm.P2_has_type, URIRef("https://clscor.io/entity/type/feature/token")),
+            (crm.P2_has_type, _token_feature_uri),
             (crm.P91i_is_unit_of, [
                 (RDF.type, crm.E54_Dimension),
                 (crm.P90_has_value, Literal(f"{bindings.token_count}", datatype=XSD.integer))
@@ -177,6 +196,8 @@ def f5_triple_generator(
         bindings: ReMBindingsModel,
         uris: URINamespace
 ) -> Iterator[_Triple]:
+    repo_literal = Literal(bindings.source.repo)
+
     f5_base_triples = ttl(
         uris.f5,
         (RDF.type, lrm.F5_Item),
@@ -184,10 +205,10 @@ def f5_triple_generator(
         (lrm.R7_exemplifies, uris.f3src),
         (crm.P49_has_former_or_current_keeper, [
             (RDF.type, lrm.F11_Corporate_Body),
-            (RDFS.label, Literal(bindings.source.repo)),
+            (RDFS.label, repo_literal),
             (crm.P1_is_identified_by, [
                 (RDF.type, crm.E41_Appellation),
-                (crm.P190_has_symbolic_content, Literal(bindings.source.repo))
+                (crm.P190_has_symbolic_content, repo_literal)
             ])
         ])
     )
@@ -238,11 +259,13 @@ def e35_triple_generator(
         bindings: ReMBindingsModel,
         uris: URINamespace
 ) -> Iterator[_Triple]:
+    title_literal = Literal(f"{bindings.title} [Title]")
+
     return ttl(
         uris.e35,
         (RDF.type, crm.E35_Title),
-        (RDFS.label, Literal(f"{bindings.title} [Title]")),
-        (crm.P190_has_symbolic_content, Literal(f"{bindings.title} [Title]")),
+        (RDFS.label, title_literal),
+        (crm.P190_has_symbolic_content, title_literal),
         (crm.P102i_is_title_of, (uris.f1, uris.f2, uris.x2)),
         (crm.P2_has_type, uris.e55_work_title),
     )
@@ -351,5 +374,5 @@ def e55_triples() -> Iterator[_Triple]:
     yield (
         mkuri("Wikidata Genre [Type]"),
         crm.P1_is_identified,
-        URIRef("https://www.wikidata.org/entity/Q483394")
+        _wikidata_genre_uri
     )
@@ -4,7 +4,7 @@ from lodkit import URIConstructorFactory
 from rdflib import URIRef
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Actor:
     name: str
     note: str | None = None
@@ -13,7 +13,8 @@ class Actor:
     _mkuri = URIConstructorFactory("https://clscor.io/entity/")
 
     def __post_init__(self):
-        self.uri = self._mkuri(self.name)
+        # frozen dataclass: derived fields must bypass __setattr__
+        object.__setattr__(self, "uri", self._mkuri(self.name))
 
 
 _actor_names: str | tuple[str, str] = [
@@ -4,20 +4,23 @@ from importlib.resources import files
 import logging
 
 from clscorgi.tool_inventory.triple_generators import generate_tool_inventory_graph
-from clscorgi.utils.reasoning.reasoner import run_reasoner
-from clscorgi.vocabs.vocabs_utils import pull_remote_vocabs
-from rdflib import Graph
+from rdflib import Graph, URIRef
 
 
 logger = logging.getLogger(__name__)
 
+_entity_prefix: str = "https://clscor.io/entity/"
+
 
 def tool_inventory_runner(pull_vocabs: bool = False, generate_inferred=False) -> None:
     """Tool Inventory runner.
 
     Generate triples and serialize to output/tool_inventory/.
+    Vocab pulling (httpx) and the reasoner (owlrl) only get imported if requested.
     """
     if pull_vocabs:
+        from clscorgi.vocabs.vocabs_utils import pull_remote_vocabs
+
         logger.info("Pulling remote vocabs.")
         pull_remote_vocabs()
 
@@ -26,31 +29,31 @@ def tool_inventory_runner(pull_vocabs: bool = False, generate_inferred=False) ->
     output_file = _output_path / "tool_inventory.ttl"
     graph = generate_tool_inventory_graph()
 
-    with open(str(output_file), "w") as f:
-        logger.info("Serializing graph to output file '%s'.", output_file)
-        f.write(graph.serialize())
+    logger.info("Serializing graph to output file '%s'.", output_file)
+    with open(str(output_file), "wb", buffering=1 << 20) as f:
+        graph.serialize(destination=f, format="turtle", encoding="utf-8")
 
     if generate_inferred:
+        from clscorgi.utils.reasoning.reasoner import run_reasoner
+
         logger.info("Running reasoner.")
         graph = run_reasoner(graph)
 
         output_file_inferred = _output_path / "tool_inventory_inferred.ttl"
 
-        query = """
-        construct {?s ?p ?o .}
-        where {
-          ?s ?p ?o .
-          filter (contains(str(?s), "https://clscor.io/entity/"))
-        }
-        """
-
-        reduced_graph: Graph = graph.query(query).graph
-
-        with open(str(output_file_inferred), "w") as f:
-            logger.info(
-                "Serializing inferred graph to output file '%s'.", output_file_inferred
-            )
-            f.write(reduced_graph.serialize())
+        # keep entity-scoped triples, i.e. subjects containing the entity namespace
+        reduced_graph = Graph()
+        reduced_graph.addN(
+            (s, p, o, reduced_graph)
+            for s, p, o in graph
+            if isinstance(s, URIRef) and _entity_prefix in s
+        )
+
+        logger.info(
+            "Serializing inferred graph to output file '%s'.", output_file_inferred
+        )
+        with open(str(output_file_inferred), "wb", buffering=1 << 20) as f:
+            reduced_graph.serialize(destination=f, format="turtle", encoding="utf-8")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 """Triple generators for Tool Inventory table to RDF conversion."""
 
 import abc
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 from importlib.resources import files
 from itertools import chain
 
@@ -18,114 +19,194 @@ crmcls = Namespace("https://clscor.io/ontologies/CRMcls/")
 clscor = Namespace("https://clscor.io/entity/")
 
 mkuri = URIConstructorFactory("https://clscor.io/entity/")
+
+# frequently used terms, bound once instead of per row
+_P3_1_has_type = crm["P3.1_has_type"]
+_P03_has_range_literal = crm["P03_has_range_literal"]
+_P01_has_domain = crm["P01_has_domain"]
+_PC3_has_note = crm.PC3_has_note
+_P3_has_note = crm.P3_has_note
+_P177_assigned_property_of_type = crm.P177_assigned_property_of_type
+_P141_assigned = crm.P141_assigned
+_P140_assigned_attribute_to = crm.P140_assigned_attribute_to
+_P134_continued = crm.P134_continued
+_E13_Attribute_Assignment = crm.E13_Attribute_Assignment
+
+# static tool description event data
+_tool_description_sources: tuple[URIRef, ...] = (
+    URIRef("https://doi.org/10.5281/zenodo.7951060"),
+    URIRef("https://doi.org/10.5281/zenodo.11094000"),
+)
+_actor_uris: tuple[URIRef, ...] = tuple(actor.uri for actor in actors)
+_tool_description_begin = Literal("2013-03-09", datatype=XSD.date)
+_tool_description_end = Literal("2025-01-31", datatype=XSD.date)
+
+# PC3 note columns of the main table: column, note type, optional
+_note_columns: tuple[tuple[str, URIRef, bool], ...] = tuple(
+    (column, crmcls[column], optional)
+    for column, optional in (
+        ("tool_description", False),
+        ("version", False),
+        ("version_date", False),
+        ("distribution", True),
+        ("user_interface", True),
+        ("text_processing", True),
+        ("metric", True),
+        ("visualisation", True),
+        ("formalism", True),
+        ("tagset", True),
+        ("statistical_models", True),
+    )
+)
+
 _data_path = files("clscorgi.tool_inventory.data")
 
 
+# sheet columns of comma-separated terms and their URI lookups
+_sheet_term_columns: dict[str, tuple[tuple[str, Callable[[str], URIRef]], ...]] = {
+    "tool_inventory": (
+        ("primary_purpose", vocabs.method),
+        ("output_format", vocabs.format),
+        ("input_format", vocabs.format),
+        ("license", vocabs.licenses),
+        ("operating_system", vocabs.operating_system),
+        ("tool_integration", mkuri),
+    ),
+    "methods": (("method", vocabs.method),),
+    "features": (("feature", vocabs.feature),),
+    "additional_links": (("link_type", vocabs.link),),
+}
+
+
+@lru_cache(maxsize=None)
+def _load_sheet(name: str) -> pd.DataFrame:
+    """Read a sheet CSV from the data directory.
+
+    Sheets are cached, so every CSV gets read once per run
+    and not once per row of the main table; treat the result as read-only.
+    Term columns get split and resolved for the whole sheet at once
+    into an additional '<column>_uris' column of URIRef tuples (NA cells stay NA).
+    """
+    df = pd.read_csv(_data_path / f"{name}.csv")
+
+    for column, lookup in _sheet_term_columns.get(name, ()):
+        df[f"{column}_uris"] = df[column].str.split(",").map(
+            lambda values: tuple(lookup(value.strip()) for value in values),
+            na_action="ignore",
+        )
+
+    return df
+
+
+@lru_cache(maxsize=None)
+def _load_sheet_partitions(name: str) -> dict[int, pd.DataFrame]:
+    """Partition a sheet by tool id once, so row lookups are dict lookups."""
+    return dict(tuple(_load_sheet(name).groupby("id", sort=False)))
+
+
+def _get_sheet_partition(name: str, tool_id: int) -> pd.DataFrame:
+    """Get the rows of a sheet that apply to a tool id.
+
+    If the sheet has no rows for tool_id, an empty DataFrame is returned.
+    """
+    partitions = _load_sheet_partitions(name)
+
+    if (partition := partitions.get(tool_id)) is None:
+        return _load_sheet(name).iloc[:0]
+    return partition
+
+
 class _ABCRowConverter(abc.ABC):
-    """ABC for pd.Series to RDF conversions.
+    """ABC for table row to RDF conversions.
 
-    Basically just an initializer and the iterator protocol.
-    Note: It is important that self._iter gets defined last
-    in the initializer; other init vars won't be accessible upon iteration.
+    Rows are the namedtuples produced by DataFrame.itertuples,
+    so columns are accessed as attributes.
+    Basically just an initializer and the iterable protocol.
     """
 
-    def __init__(self, series: pd.Series) -> None:
+    def __init__(self, series: tuple) -> None:
         self.series = series
 
-        self.tool_uri = mkuri(self.series["toolname"])
-        self.tool_descevent_uri = mkuri(f"{self.series['toolname']} descevent")
-
-        self._iter = iter(self)
+        self.tool_uri = mkuri(self.series.toolname)
+        self.tool_descevent_uri = mkuri(f"{self.series.toolname} descevent")
 
     @abc.abstractmethod
     def __iter__(self) -> Iterator[_Triple]:
         raise NotImplementedError
 
-    def __next__(self) -> _Triple:
-        return next(self._iter)
-
 
 class _MethodsRowConverter(_ABCRowConverter):
     """RowConverter for the 'methods' table."""
 
     def __iter__(self) -> Iterator[_Triple]:
-        return chain(self._generate_task_description_triples())
+        return self._generate_task_description_triples()
 
     def _generate_task_description_triples(self) -> Iterator[_Triple]:
-        methods = tuple(
-            vocabs.method(value.strip()) for value in self.series["method"].split(",")
-        )
-
+        methods = self.series.method_uris
         e13_uri = mkuri()
 
         yield from ttl(
             e13_uri,
-            (RDF.type, crm.E13_Attribute_Assignment),
-            (crm.P134_continued, self.tool_descevent_uri),
-            (crm.P140_assigned_attribute_to, self.tool_uri),
-            (crm.P141_assigned, methods),
-            (crm.P177_assigned_property_of_type, crmcls.Y8_implements),
+            (RDF.type, _E13_Attribute_Assignment),
+            (_P134_continued, self.tool_descevent_uri),
+            (_P140_assigned_attribute_to, self.tool_uri),
+            (_P141_assigned, methods),
+            (_P177_assigned_property_of_type, crmcls.Y8_implements),
         )
 
-        if pd.isna(methods_used := self.series["method_comment"]):
+        if pd.isna(methods_used := self.series.method_comment):
             return
 
-        yield (e13_uri, crm.P3_has_note, Literal(methods_used))
+        yield (e13_uri, _P3_has_note, Literal(methods_used))
 
 
 class _FeaturesRowConverter(_ABCRowConverter):
     """RowConverter for the 'featues' table."""
 
     def __iter__(self) -> Iterator[_Triple]:
-        return chain(self._generate_feature_triples())
+        return self._generate_feature_triples()
 
     def _generate_feature_triples(self) -> Iterator[_Triple]:
-        features = tuple(
-            vocabs.feature(value.strip()) for value in self.series["feature"].split(",")
-        )
-
+        features = self.series.feature_uris
         e13_uri = mkuri()
 
         yield from ttl(
             e13_uri,
-            (RDF.type, crm.E13_Attribute_Assignment),
-            (crm.P134_continued, self.tool_descevent_uri),
-            (crm.P140_assigned_attribute_to, self.tool_uri),
-            (crm.P141_assigned, features),
-            (crm.P177_assigned_property_of_type, crmcls.Y1_exhibits_feature),
+            (RDF.type, _E13_Attribute_Assignment),
+            (_P134_continued, self.tool_descevent_uri),
+            (_P140_assigned_attribute_to, self.tool_uri),
+            (_P141_assigned, features),
+            (_P177_assigned_property_of_type, crmcls.Y1_exhibits_feature),
         )
 
-        if pd.isna(features_used := self.series["feature_comment"]):
+        if pd.isna(features_used := self.series.feature_comment):
             return
 
-        yield (e13_uri, crm.P3_has_note, Literal(features_used))
+        yield (e13_uri, _P3_has_note, Literal(features_used))
 
 
 class _RelatedPapersRowConverter(_ABCRowConverter):
     def __iter__(self) -> Iterator[_Triple]:
-        return chain(self._generate_related_papers_triples())
+        return self._generate_related_papers_triples()
 
     def _generate_related_papers_triples(self) -> Iterator[_Triple]:
-        related_papers_literal = self.series["related_paper"]
+        related_papers_literal = self.series.related_paper
 
         return ttl(
             mkuri(related_papers_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["related_paper"]),
-            (crm["P03_has_range_literal"], related_papers_literal),
-            (crm["P01_has_domain"], self.tool_uri),
+            (RDF.type, _PC3_has_note),
+            (_P3_1_has_type, crmcls["related_paper"]),
+            (_P03_has_range_literal, related_papers_literal),
+            (_P01_has_domain, self.tool_uri),
         )
 
 
 class _AdditionalLinkRowConverter(_ABCRowConverter):
     def __iter__(self) -> Iterator[_Triple]:
-        return chain(self._generate_additional_link_triples())
+        return self._generate_additional_link_triples()
 
     def _generate_additional_link_triples(self) -> Iterator[_Triple]:
-        link = tuple(
-            vocabs.link(value.strip()) for value in self.series["link_type"].split(",")
-        )
-
+        link = self.series.link_type_uris
         e42_uri = mkuri()
 
         yield from ttl(
@@ -135,16 +216,16 @@ class _AdditionalLinkRowConverter(_ABCRowConverter):
                 ttl(
                     e42_uri,
                     (RDF.type, crm.E42_Identifier),
-                    (crm.P190_has_symbolic_content, self.series["link"]),
+                    (crm.P190_has_symbolic_content, self.series.link),
                     (crm.P2_has_type, link),
                 ),
             ),
         )
 
-        if pd.isna(link_comment := self.series["link_comment"]):
+        if pd.isna(link_comment := self.series.link_comment):
             return
 
-        yield (e42_uri, crm.P3_has_note, Literal(link_comment))
+        yield (e42_uri, _P3_has_note, Literal(link_comment))
 
 
 class ToolInventoryRowConverter(_ABCRowConverter):
@@ -157,21 +238,11 @@ class ToolInventoryRowConverter(_ABCRowConverter):
     def __iter__(self) -> Iterator[_Triple]:
         return chain(
             self.generate_appellation_triples(),
-            self.generate_tool_description_triples(),
+            self.generate_note_triples(),
             self.generate_tool_descevent_triples(),
             self.generate_primary_purpose_triples(),
-            self.generate_version_note_triples(),
-            self.generate_version_date_triples(),
-            self.generate_distribution_triples(),
-            self.generate_user_interface_triples(),
-            self.generate_tool_processing_triples(),
             self.generate_output_format_triples(),
             self.generate_input_format_triples(),
-            self.generate_metric_triples(),
-            self.generate_visualisation_triples(),
-            self.generate_formalism_triples(),
-            self.generate_tagset_triples(),
-            self.generate_statistical_models_triples(),
             self.generate_license_triples(),
             self.generate_os_triples(),
             self.generate_language_triples(),
@@ -193,12 +264,12 @@ class ToolInventoryRowConverter(_ABCRowConverter):
                     mkuri(),
                     (RDF.type, crm.E41_Appellation),
                     (crm.P2_has_type, vocabs.appellation("tool name")),
-                    (RDF.value, self.series["toolname"]),
+                    (RDF.value, self.series.toolname),
                 ),
             ),
         )
 
-        if not pd.isna(alternate_name := self.series["alternate_name"]):
+        if not pd.isna(alternate_name := self.series.alternate_name):
             yield from ttl(
                 self.tool_uri,
                 (
@@ -212,265 +283,135 @@ class ToolInventoryRowConverter(_ABCRowConverter):
                 ),
             )
 
-    def generate_tool_description_triples(self) -> Iterator[_Triple]:
-        tool_description_literal: str = self.series["tool_description"]
+    def generate_note_triples(self) -> Iterator[_Triple]:
+        """Generate PC3 note triples for the note columns of the main table.
 
-        return ttl(
-            mkuri(tool_description_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["tool_description"]),
-            (crm["P03_has_range_literal"], tool_description_literal),
-            (crm["P01_has_domain"], self.tool_uri),
-        )
+        See _note_columns; optional columns are skipped if empty and get stripped.
+        """
+        for column, note_type, optional in _note_columns:
+            note_value = getattr(self.series, column)
+
+            if optional:
+                if pd.isna(note_value):
+                    continue
+                note_literal = note_value.strip()
+            else:
+                note_literal = note_value
+
+            yield from ttl(
+                mkuri(note_value),
+                (RDF.type, _PC3_has_note),
+                (_P3_1_has_type, note_type),
+                (_P03_has_range_literal, note_literal),
+                (_P01_has_domain, self.tool_uri),
+            )
 
     def generate_tool_descevent_triples(self) -> Iterator[_Triple]:
         return ttl(
             self.tool_descevent_uri,
             (RDF.type, crmcls.X13_Tool_Description),
-            (
-                crm.P16_used_specific_object,
-                (
-                    URIRef("https://doi.org/10.5281/zenodo.7951060"),
-                    URIRef("https://doi.org/10.5281/zenodo.11094000"),
-                ),
-            ),
-            (crm.P14_carried_out_by, tuple(actor.uri for actor in actors)),
+            (crm.P16_used_specific_object, _tool_description_sources),
+            (crm.P14_carried_out_by, _actor_uris),
             (
                 crm["P4_has_time-span"],
                 [
                     (RDF.type, crm["E52_Time-Span"]),
-                    (
-                        crm.P81a_end_of_the_begin,
-                        Literal("2013-03-09", datatype=XSD.date),
-                    ),
-                    (
-                        crm.P81b_begin_of_the_end,
-                        Literal("2025-01-31", datatype=XSD.date),
-                    ),
+                    (crm.P81a_end_of_the_begin, _tool_description_begin),
+                    (crm.P81b_begin_of_the_end, _tool_description_end),
                 ],
             ),
         )
 
     def generate_primary_purpose_triples(self) -> Iterator[_Triple]:
-        methods = tuple(
-            vocabs.method(value.strip())
-            for value in self.series["primary_purpose"].split(",")
-        )
+        methods = self.series.primary_purpose_uris
 
         return ttl(
             mkuri(),
-            (RDF.type, crm.E13_Attribute_Assignment),
-            (crm.P134_continued, self.tool_descevent_uri),
-            (crm.P140_assigned_attribute_to, self.tool_uri),
-            (crm.P141_assigned, methods),
-            (crm.P177_assigned_property_of_type, crmcls.Y8_implements),
-        )
-
-    def generate_version_note_triples(self) -> Iterator[_Triple]:
-        note_literal = self.series["version"]
-
-        return ttl(
-            mkuri(note_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["version"]),
-            (crm["P03_has_range_literal"], note_literal),
-            (crm["P01_has_domain"], self.tool_uri),
-        )
-
-    def generate_version_date_triples(self) -> Iterator[_Triple]:
-        date_literal = self.series["version_date"]
-
-        return ttl(
-            mkuri(date_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["version_date"]),
-            (crm["P03_has_range_literal"], date_literal),
-            (crm["P01_has_domain"], self.tool_uri),
-        )
-
-    def generate_distribution_triples(self) -> Iterator[_Triple]:
-        if pd.isna(distribution_literal := self.series["distribution"]):
-            return
-
-        yield from ttl(
-            mkuri(distribution_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["distribution"]),
-            (crm["P03_has_range_literal"], distribution_literal.strip()),
-            (crm["P01_has_domain"], self.tool_uri),
-        )
-
-    def generate_user_interface_triples(self) -> Iterator[_Triple]:
-        if pd.isna(userinterface_literal := self.series["user_interface"]):
-            return
-
-        yield from ttl(
-            mkuri(userinterface_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["user_interface"]),
-            (crm["P03_has_range_literal"], userinterface_literal.strip()),
-            (crm["P01_has_domain"], self.tool_uri),
-        )
-
-    def generate_tool_processing_triples(self) -> Iterator[_Triple]:
-        if pd.isna(textprocessing_literal := self.series["text_processing"]):
-            return
-
-        yield from ttl(
-            mkuri(textprocessing_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["text_processing"]),
-            (crm["P03_has_range_literal"], textprocessing_literal.strip()),
-            (crm["P01_has_domain"], self.tool_uri),
+            (RDF.type, _E13_Attribute_Assignment),
+            (_P134_continued, self.tool_descevent_uri),
+            (_P140_assigned_attribute_to, self.tool_uri),
+            (_P141_assigned, methods),
+            (_P177_assigned_property_of_type, crmcls.Y8_implements),
         )
 
     def generate_output_format_triples(self) -> Iterator[_Triple]:
-        if pd.isna(output_format := self.series["output_format"]):
+        if pd.isna(self.series.output_format):
             return
 
         e13_uri = mkuri()
-        formats = tuple(
-            vocabs.format(value.strip()) for value in output_format.split(",")
-        )
+        formats = self.series.output_format_uris
 
         yield from ttl(
             e13_uri,
-            (RDF.type, crm.E13_Attribute_Assignment),
-            (crm.P134_continued, self.tool_descevent_uri),
-            (crm.P140_assigned_attribute_to, self.tool_uri),
-            (crm.P141_assigned, formats),
-            (crm.P177_assigned_property_of_type, crmcls.Y10_generates_output),
+            (RDF.type, _E13_Attribute_Assignment),
+            (_P134_continued, self.tool_descevent_uri),
+            (_P140_assigned_attribute_to, self.tool_uri),
+            (_P141_assigned, formats),
+            (_P177_assigned_property_of_type, crmcls.Y10_generates_output),
         )
 
-        if not pd.isna(output_comment := self.series["output_format_comment"]):
-            yield from ttl(e13_uri, (crm.P3_has_note, output_comment.strip()))
+        if not pd.isna(output_comment := self.series.output_format_comment):
+            yield from ttl(e13_uri, (_P3_has_note, output_comment.strip()))
 
     def generate_input_format_triples(self) -> Iterator[_Triple]:
-        if pd.isna(input_format := self.series["input_format"]):
+        if pd.isna(self.series.input_format):
             return
 
         e13_uri = mkuri()
-        formats = tuple(
-            vocabs.format(value.strip()) for value in input_format.split(",")
-        )
+        formats = self.series.input_format_uris
 
         yield from ttl(
             e13_uri,
-            (RDF.type, crm.E13_Attribute_Assignment),
-            (crm.P134_continued, self.tool_descevent_uri),
-            (crm.P140_assigned_attribute_to, self.tool_uri),
-            (crm.P141_assigned, formats),
-            (crm.P177_assigned_property_of_type, crmcls.Y9_expects_input),
+            (RDF.type, _E13_Attribute_Assignment),
+            (_P134_continued, self.tool_descevent_uri),
+            (_P140_assigned_attribute_to, self.tool_uri),
+            (_P141_assigned, formats),
+            (_P177_assigned_property_of_type, crmcls.Y9_expects_input),
         )
 
-        if not pd.isna(input_comment := self.series["input_format_comment"]):
-            yield from ttl(e13_uri, (crm.P3_has_note, input_comment.strip()))
-
-    def generate_metric_triples(self) -> Iterator[_Triple]:
-        if pd.isna(metric_literal := self.series["metric"]):
-            return
-
-        yield from ttl(
-            mkuri(metric_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["metric"]),
-            (crm["P03_has_range_literal"], metric_literal.strip()),
-            (crm["P01_has_domain"], self.tool_uri),
-        )
-
-    def generate_visualisation_triples(self) -> Iterator[_Triple]:
-        if pd.isna(visualisation_literal := self.series["visualisation"]):
-            return
-
-        yield from ttl(
-            mkuri(visualisation_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["visualisation"]),
-            (crm["P03_has_range_literal"], visualisation_literal.strip()),
-            (crm["P01_has_domain"], self.tool_uri),
-        )
-
-    def generate_formalism_triples(self) -> Iterator[_Triple]:
-        if pd.isna(formalism_literal := self.series["formalism"]):
-            return
-
-        yield from ttl(
-            mkuri(formalism_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["formalism"]),
-            (crm["P03_has_range_literal"], formalism_literal.strip()),
-            (crm["P01_has_domain"], self.tool_uri),
-        )
-
-    def generate_tagset_triples(self) -> Iterator[_Triple]:
-        if pd.isna(tagset_literal := self.series["tagset"]):
-            return
-
-        yield from ttl(
-            mkuri(tagset_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["tagset"]),
-            (crm["P03_has_range_literal"], tagset_literal.strip()),
-            (crm["P01_has_domain"], self.tool_uri),
-        )
-
-    def generate_statistical_models_triples(self) -> Iterator[_Triple]:
-        if pd.isna(statistical_models_literal := self.series["statistical_models"]):
-            return
-
-        yield from ttl(
-            mkuri(statistical_models_literal),
-            (RDF.type, crm.PC3_has_note),
-            (crm["P3.1_has_type"], crmcls["statistical_models"]),
-            (crm["P03_has_range_literal"], statistical_models_literal.strip()),
-            (crm["P01_has_domain"], self.tool_uri),
-        )
+        if not pd.isna(input_comment := self.series.input_format_comment):
+            yield from ttl(e13_uri, (_P3_has_note, input_comment.strip()))
 
     def generate_license_triples(self) -> Iterator[_Triple]:
-        if pd.isna(_license := self.series["license"]):
+        if pd.isna(self.series.license):
             return
 
         e13_uri = mkuri()
-        licenses = tuple(
-            vocabs.licenses(value.strip()) for value in _license.split(",")
-        )
+        licenses = self.series.license_uris
 
         yield from ttl(
             e13_uri,
-            (RDF.type, crm.E13_Attribute_Assignment),
-            (crm.P134_continued, self.tool_descevent_uri),
-            (crm.P140_assigned_attribute_to, self.tool_uri),
-            (crm.P141_assigned, licenses),
-            (crm.P177_assigned_property_of_type, crm.P2_has_type),
+            (RDF.type, _E13_Attribute_Assignment),
+            (_P134_continued, self.tool_descevent_uri),
+            (_P140_assigned_attribute_to, self.tool_uri),
+            (_P141_assigned, licenses),
+            (_P177_assigned_property_of_type, crm.P2_has_type),
         )
 
-        if not pd.isna(output_comment := self.series["license_comment"]):
-            yield from ttl(e13_uri, (crm.P3_has_note, output_comment.strip()))
+        if not pd.isna(output_comment := self.series.license_comment):
+            yield from ttl(e13_uri, (_P3_has_note, output_comment.strip()))
 
     def generate_os_triples(self) -> Iterator[_Triple]:
-        if pd.isna(operating_system := self.series["operating_system"]):
+        if pd.isna(self.series.operating_system):
             return
 
         e13_uri = mkuri()
-        operating_system = tuple(
-            vocabs.operating_system(value.strip())
-            for value in operating_system.split(",")
-        )
+        operating_system = self.series.operating_system_uris
 
         yield from ttl(
             e13_uri,
-            (RDF.type, crm.E13_Attribute_Assignment),
-            (crm.P134_continued, self.tool_descevent_uri),
-            (crm.P140_assigned_attribute_to, self.tool_uri),
-            (crm.P141_assigned, operating_system),
-            (crm.P177_assigned_property_of_type, crm.P2_has_type),
+            (RDF.type, _E13_Attribute_Assignment),
+            (_P134_continued, self.tool_descevent_uri),
+            (_P140_assigned_attribute_to, self.tool_uri),
+            (_P141_assigned, operating_system),
+            (_P177_assigned_property_of_type, crm.P2_has_type),
         )
 
-        if not pd.isna(output_comment := self.series["operating_system_comment"]):
-            yield from ttl(e13_uri, (crm.P3_has_note, output_comment.strip()))
+        if not pd.isna(output_comment := self.series.operating_system_comment):
+            yield from ttl(e13_uri, (_P3_has_note, output_comment.strip()))
 
     def generate_language_triples(self) -> Iterator[_Triple]:
-        if pd.isna(language_data := self.series["language"]):
+        if pd.isna(language_data := self.series.language):
             return
 
         e13_uri = mkuri()
@@ -483,22 +424,22 @@ class ToolInventoryRowConverter(_ABCRowConverter):
 
         yield from ttl(
             e13_uri,
-            (crm.P134_continued, self.tool_descevent_uri),
-            (crm.P140_assigned_attribute_to, self.tool_uri),
-            (crm.P141_assigned, tuple(language_iso_uris.values())),
-            (crm.P177_assigned_property_of_type, crm.P72_has_language),
+            (_P134_continued, self.tool_descevent_uri),
+            (_P140_assigned_attribute_to, self.tool_uri),
+            (_P141_assigned, tuple(language_iso_uris.values())),
+            (_P177_assigned_property_of_type, crm.P72_has_language),
         )
 
-        if pd.isna(language_comment := self.series["language_comment"]):
+        if pd.isna(language_comment := self.series.language_comment):
             return
 
-        yield from ttl(e13_uri, (crm.P3_has_note, language_comment.strip()))
+        yield from ttl(e13_uri, (_P3_has_note, language_comment.strip()))
 
     def generate_tool_integration_triples(self) -> Iterator[_Triple]:
-        if pd.isna(tool := self.series["tool_integration"]):
+        if pd.isna(self.series.tool_integration):
             return
 
-        tools = tuple(mkuri(value.strip()) for value in tool.split(","))
+        tools = self.series.tool_integration_uris
         yield from ttl(self.tool_uri, (crmcls.Y7_uses, tools))
 
     ## other sheets
@@ -508,34 +449,29 @@ class ToolInventoryRowConverter(_ABCRowConverter):
         This generator needs to look up the applicable rows
         in the respective sheet and loop + yield from those series.
 
-        Obviously, this design is flawed, as the csv gets read and partitioned
-        at ever row iteration of the main table.
+        Sheets are read and partitioned by id once (see _load_sheet_partitions).
         """
-        df: pd.DataFrame = pd.read_csv(_data_path / "methods.csv")
-        partition: pd.DataFrame = df[df["id"] == self.series["id"]]
+        partition: pd.DataFrame = _get_sheet_partition("methods", self.series.id)
 
-        for _, row in partition.iterrows():
+        for row in partition.itertuples(index=False):
             yield from _MethodsRowConverter(row)
 
     def generate_features_triples(self):
-        df: pd.DataFrame = pd.read_csv(_data_path / "features.csv")
-        partition: pd.DataFrame = df[df["id"] == self.series["id"]]
+        partition: pd.DataFrame = _get_sheet_partition("features", self.series.id)
 
-        for _, row in partition.iterrows():
+        for row in partition.itertuples(index=False):
             yield from _FeaturesRowConverter(row)
 
     def generate_related_papers_triples(self):
-        df: pd.DataFrame = pd.read_csv(_data_path / "related_papers.csv")
-        partition: pd.DataFrame = df[df["id"] == self.series["id"]]
+        partition: pd.DataFrame = _get_sheet_partition("related_papers", self.series.id)
 
-        for _, row in partition.iterrows():
+        for row in partition.itertuples(index=False):
             yield from _RelatedPapersRowConverter(row)
 
     def generate_additional_link_triples(self):
-        df: pd.DataFrame = pd.read_csv(_data_path / "additional_links.csv")
-        partition: pd.DataFrame = df[df["id"] == self.series["id"]]
+        partition: pd.DataFrame = _get_sheet_partition("additional_links", self.series.id)
 
-        for _, row in partition.iterrows():
+        for row in partition.itertuples(index=False):
             yield from _AdditionalLinkRowConverter(row)
 
 
@@ -549,11 +485,11 @@ def generate_actor_triples() -> Iterator[_Triple]:
         yield from ttl(actor.uri, (RDF.type, crm.E39_Actor), (RDFS.label, actor.name))
 
         if (note := actor.note) is not None:
-            yield (actor.uri, crm.P3_has_note, Literal(note))
+            yield (actor.uri, _P3_has_note, Literal(note))
 
 
 def generate_tool_inventory_graph() -> Graph:
-    df_tool_inventory = pd.read_csv(_data_path / "tool_inventory.csv")
+    df_tool_inventory = _load_sheet("tool_inventory")
 
     class CLSGraph(NamespaceGraph):
         crm = Namespace("http://www.cidoc-crm.org/cidoc-crm/")
@@ -564,10 +500,10 @@ def generate_tool_inventory_graph() -> Graph:
 
     actor_triples = generate_actor_triples()
     table_triples = chain.from_iterable(
-        ToolInventoryRowConverter(row) for _, row in df_tool_inventory.iterrows()
+        ToolInventoryRowConverter(row)
+        for row in df_tool_inventory.itertuples(index=False)
     )
 
-    for triple in chain(table_triples, actor_triples):
-        graph.add(triple)
+    graph.addN((s, p, o, graph) for s, p, o in chain(table_triples, actor_triples))
 
     return graph
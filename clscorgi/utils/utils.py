@@ -66,6 +66,20 @@ def _or(
     return None
 
 
+_base_uri: str = "https://clscor.io/entity/"
+
+
+@functools.lru_cache(maxsize=4096)
+def _mkuri_hashed(hash_value: str, length: int | None, hash_function: Callable) -> URIRef:
+    """Create a hash-based CLSCor entity URI.
+
+    Hash-based URIs are deterministic, so repeated values
+    (e.g. repo IDs or type labels) get served from the cache.
+    """
+    _path: str = generate_uri_hash(hash_value, length=length, hash_function=hash_function)
+    return URIRef(f"{_base_uri}{_path[:length]}")
+
+
 def mkuri(
     hash_value: str | None = None,
     length: int | None = 10,
@@ -76,13 +90,10 @@ def mkuri(
     If a hash value is give, the path is generated using
     a hash function, else the path is generated using a uuid4.
     """
-    _base_uri: str = "https://clscor.io/entity/"
-    _path: str = (
-        str(uuid4())
-        if hash_value is None
-        else generate_uri_hash(hash_value, length=length, hash_function=hash_function)
-    )
+    if hash_value is not None:
+        return _mkuri_hashed(hash_value, length, hash_function)
 
+    _path: str = str(uuid4())
     return URIRef(f"{_base_uri}{_path[:length]}")
 
 
@@ -202,6 +213,7 @@ def ntimes(*, n: int = 1, default: Any = None) -> Callable[[Callable], Any]:
 static: Callable[[Callable], Any] = ntimes(n=1, default=tuple())
 
 
+@functools.lru_cache(maxsize=None)
 def get_language_uri(
     lang: str,
     default_factory: Callable[[str], URIRef] = lambda lang: URIConstructorFactory(
@@ -1,7 +1,7 @@
 """Generic Vocab Lookup Utility. This is intended to supersed the clscorgi.vocabs.vocabs solution."""
 
 from collections.abc import Callable
-from functools import partial
+from functools import lru_cache, partial
 from importlib.resources import files
 import os
 
@@ -31,8 +31,10 @@ class Vocabs:
             graph if isinstance(graph, Graph) else Graph().parse(graph)
             for _, graph in self._vocabs.items()
         ]
+        # vocabs are small and static, so lookups get memoized per vocab;
+        # failed lookups raise and are not cached
         self._lookup_map: dict[str, Callable[[str], URIRef]] = {
-            name: partial(self._lookup_term, graph=graph)
+            name: lru_cache(maxsize=None)(partial(self._lookup_term, graph=graph))
             for name, graph in zip(self._vocabs.keys(), self._vocab_graphs)
         }
 
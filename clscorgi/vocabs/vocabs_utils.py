@@ -1,11 +1,14 @@
 """General utilities concerning vocabs."""
 
+import json
 from collections.abc import Iterable
 from importlib.resources import files
 from pathlib import Path
 from urllib.parse import urlparse
 
 import httpx
+from rdflib import Graph
+from rdflib.namespace import RDFS
 
 
 def _pull_remote_vocab(vocab_url: str) -> None:
@@ -36,3 +39,21 @@ vocab_urls = [
 def pull_remote_vocabs():
     """Pull all remote vocabs specified in vocab_urls."""
     _pull_remote_vocabs(vocab_urls)
+
+
+def dump_id_types() -> None:
+    """Write the rdfs:label terms of the identifier vocab to _id_types.json.
+
+    clscorgi.models reads the ID types from this file instead of parsing
+    identifier.ttl on import; rerun this after changing identifier.ttl.
+    """
+    vocabs_path = files("clscorgi.vocabs")
+    graph = Graph().parse(str(vocabs_path / "identifier.ttl"))
+    id_types = list(map(str, graph.objects(None, RDFS.label)))
+
+    with open(str(vocabs_path / "_id_types.json"), "w") as f:
+        json.dump(id_types, f, indent=4)
+
+
+if __name__ == "__main__":
+    dump_id_types()
@@ -0,0 +1,52 @@
+"""Tests for the DLK tree extractors."""
+
+import pytest
+
+from clscorgi.dlk.extractors.tree_extractors import iterextract
+
+_AUTHOR = "<persName><forename>Anna</forename><surname>Karsch</surname></persName>"
+
+_TEI_TEMPLATE = """<TEI xmlns="http://www.tei-c.org/ns/1.0"><teiHeader><fileDesc>
+<titleStmt><title>Ein Titel</title><author>{author}</author></titleStmt>
+<extent><measure type="tokens">12</measure><measure type="lines">2</measure></extent>
+<publicationStmt><date type="publication">1764</date></publicationStmt>
+<sourceDesc><p corresp="urn:nbn:de:kobv:b4-1">Source</p></sourceDesc>
+</fileDesc></teiHeader><text><body><lg type="poem"><lg>
+<l>Als Gott die Welt erschuf,</l><l>zwei</l>
+</lg></lg></body></text></TEI>"""
+
+_expected = {
+    "urn": "urn:nbn:de:kobv:b4-1",
+    "authors": [
+        {"forename": "Anna", "surname": "Karsch", "full_name": "Anna Karsch"}
+    ],
+    "title": "Ein Titel",
+    "artificial_title": "Als gott die welt",
+    "features_dlk": {"tokens": "12", "lines": "2"},
+    "publication_date": "1764",
+}
+
+
+@pytest.mark.parametrize(
+    "author",
+    [
+        _AUTHOR,
+        f"{_AUTHOR}<date>1722</date>",
+        f"{_AUTHOR}<title>Dichterin</title>",
+        f"{_AUTHOR}<p>Note</p>",
+        f"<date>1722</date>{_AUTHOR}",
+    ],
+)
+def test_iterextract(author):
+    """Candidate tags nested in tei:author must not prune the author's names."""
+    source = _TEI_TEMPLATE.format(author=author).encode()
+    assert iterextract(source) == _expected
+
+
+def test_iterextract_missing_urn():
+    source = _TEI_TEMPLATE.format(author=_AUTHOR).replace(
+        ' corresp="urn:nbn:de:kobv:b4-1"', ""
+    )
+
+    with pytest.raises(IndexError):
+        iterextract(source.encode())